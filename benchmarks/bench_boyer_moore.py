@@ -0,0 +1,66 @@
+"""
+Comparação entre o Boyer-Moore com tabelas em dicionário e a variante compacta (BoyerMooreCompact).
+
+Utilização:
+    python benchmarks/bench_boyer_moore.py [tamanho_genoma] [tamanho_padrao]
+"""
+
+# Add parent dir to path to ensure module is found
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from time import perf_counter
+
+from boyer_moore.BoyerMoore import BoyerMoore, BoyerMooreCompact
+from utils.gerador_seqs import gerador_seqs
+
+def cronometrar(funcao, *args, repeticoes : int = 3) -> tuple:
+    """
+    Executa uma função várias vezes e devolve o melhor tempo e o último resultado.
+
+    Parâmetros:
+        funcao: A função a executar.
+        args: Os argumentos da função.
+        repeticoes (int): Número de execuções. Padrão é 3.
+
+    Retorna:
+        tuple: O melhor tempo (segundos) e o resultado da função.
+    """
+
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = perf_counter()
+        res = funcao(*args)
+        melhor = min(melhor, perf_counter() - inicio)
+    return melhor, res
+
+def main(tamanho_genoma : int = 2_000_000, tamanho_padrao : int = 12, semente : int = 42) -> None:
+    """
+    Gera um genoma aleatório e compara os tempos de procura das duas implementações.
+
+    Parâmetros:
+        tamanho_genoma (int): Comprimento do genoma gerado. Padrão é 2 Mbp.
+        tamanho_padrao (int): Comprimento do padrão procurado. Padrão é 12.
+        semente (int): Semente do gerador aleatório. Padrão é 42.
+
+    Retorna:
+        None
+    """
+
+    random.seed(semente)
+    genoma = gerador_seqs(tamanho_genoma, 1)[0]
+    genoma_bytes = genoma.encode("ascii")
+    padrao = genoma[tamanho_genoma // 2:tamanho_genoma // 2 + tamanho_padrao]
+
+    t_dict, res_dict = cronometrar(BoyerMoore("ACGT", padrao).search_pattern, genoma)
+    t_comp, res_comp = cronometrar(BoyerMooreCompact("ACGT", padrao).search_pattern, genoma_bytes)
+    assert res_dict == res_comp, "As duas implementações devolveram resultados diferentes"
+
+    print(f"genoma: {tamanho_genoma} bp, padrão: {tamanho_padrao} bp, ocorrências: {len(res_dict)}")
+    print(f"dict   : {t_dict:.3f} s")
+    print(f"compact: {t_comp:.3f} s ({t_dict / t_comp:.2f}x)")
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,162 @@
+"""
+Comparação dos motores de procura exata de padrões do repositório:
+BoyerMoore, Automato, ArvoreDeSufixos e o índice FM sobre a transformada de Burrows-Wheeler.
+
+Para cada motor, tamanho de texto, tamanho de padrão e alfabeto são reportados o tempo de
+construção, a latência média por consulta, o débito (bp de texto por segundo de consulta),
+o pico de memória (tracemalloc) e o número de ocorrências. Os textos são gerados com
+utils.gerador_seqs a partir de uma semente fixa, e os resultados dos motores são comparados
+entre si para detetar regressões.
+
+Utilização:
+    python benchmarks/bench_matching.py [--tamanhos 1000 10000] [--padroes 8 32] [--semente 42]
+"""
+
+# Add parent dir to path to ensure module is found
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import tracemalloc
+from time import perf_counter
+
+from boyer_moore.BoyerMoore import BoyerMoore
+from finite_state_machines.Automatos_Finitos import Automato
+from suffix_trees.Arvore_De_Sufixos import ArvoreDeSufixos
+from burrows_wheeler_transform import FMIndex
+from utils.gerador_seqs import gerador_seqs
+
+DNA = "ACGT"
+PROTEINA = "ACDEFGHIKLMNPQRSTVWY"
+
+def _construir_arvore(texto : str, padroes : list, alfabeto : str) -> ArvoreDeSufixos:
+    arvore = ArvoreDeSufixos()
+    arvore.build_arvore_de_sufixos(texto)
+    return arvore
+
+# nome -> (construir(texto, padroes, alfabeto), consultar(estado, texto, padrao), tamanho máximo do texto, alfabetos suportados)
+# Os motores que pré-processam o padrão constroem um objeto por padrão; os que indexam o texto constroem um único índice.
+MOTORES = {
+    "BoyerMoore": (
+        lambda texto, padroes, alfabeto: {p: BoyerMoore(alfabeto, p) for p in padroes},
+        lambda estado, texto, padrao: estado[padrao].search_pattern(texto),
+        None, None),
+    "Automato": (
+        lambda texto, padroes, alfabeto: {p: Automato(p, "") for p in padroes},
+        lambda estado, texto, padrao: estado[padrao].encontrar_ocorrencias(texto),
+        None, {DNA}),
+    "ArvoreDeSufixos": (
+        _construir_arvore,
+        lambda estado, texto, padrao: sorted(estado.encontrar_padrao(padrao) or []),
+        1_000, None),
+    "FMIndex": (
+        lambda texto, padroes, alfabeto: FMIndex.da_sequencia(texto),
+        lambda estado, texto, padrao: estado.locate(padrao),
+        None, None),
+}
+
+def medir(motor : str, texto : str, padroes : list, alfabeto : str) -> dict:
+    """
+    Mede um motor sobre um texto e um conjunto de padrões.
+
+    Parâmetros:
+        motor (str): Nome do motor em MOTORES.
+        texto (str): O texto onde procurar.
+        padroes (list): Os padrões a procurar.
+        alfabeto (str): O alfabeto do texto.
+
+    Retorna:
+        dict: Tempo de construção (s), latência média (s), débito (bp/s), pico de memória (bytes)
+              e resultados por padrão.
+    """
+
+    construir, consultar, _, _ = MOTORES[motor]
+
+    inicio = perf_counter()
+    estado = construir(texto, padroes, alfabeto)
+    t_construcao = perf_counter() - inicio
+
+    resultados = {}
+    inicio = perf_counter()
+    for p in padroes:
+        resultados[p] = consultar(estado, texto, p)
+    latencia = (perf_counter() - inicio) / len(padroes)
+    del estado
+
+    # Segunda execução, instrumentada, apenas para o pico de memória
+    tracemalloc.start()
+    estado = construir(texto, padroes, alfabeto)
+    for p in padroes:
+        consultar(estado, texto, p)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "construcao": t_construcao,
+        "latencia": latencia,
+        "debito": len(texto) / latencia if latencia else None,
+        "memoria": pico,
+        "resultados": resultados,
+    }
+
+def _formatar(valor, escala : float = 1.0, casas : int = 3) -> str:
+    return "-" if valor is None else f"{valor * escala:.{casas}f}"
+
+def main(tamanhos : list, tamanhos_padrao : list, alfabetos : list, consultas : int, semente : int) -> None:
+    """
+    Corre todas as combinações de motor, alfabeto, tamanho de texto e tamanho de padrão.
+
+    Parâmetros:
+        tamanhos (list): Comprimentos dos textos gerados.
+        tamanhos_padrao (list): Comprimentos dos padrões.
+        alfabetos (list): Alfabetos dos textos.
+        consultas (int): Número de padrões por combinação.
+        semente (int): Semente do gerador aleatório.
+
+    Retorna:
+        None
+    """
+
+    print(f"{'motor':<16}{'alfabeto':>9}{'n':>9}{'m':>5}{'constr. (s)':>13}"
+          f"{'latência (ms)':>15}{'débito (Mbp/s)':>16}{'memória (MB)':>14}{'ocorr.':>8}")
+    for alfabeto in alfabetos:
+        for n in tamanhos:
+            random.seed(semente)
+            texto = gerador_seqs(n, 1, alfabeto)[0]
+            for m in tamanhos_padrao:
+                if m > n:
+                    continue
+                # Metade dos padrões é retirada do texto (com ocorrências), a outra metade é aleatória
+                padroes = []
+                for i in range(consultas):
+                    if i % 2 == 0:
+                        pos = random.randint(0, n - m)
+                        padroes.append(texto[pos:pos + m])
+                    else:
+                        padroes.append(gerador_seqs(m, 1, alfabeto)[0])
+
+                referencia = None
+                for motor, (_, _, limite, suportados) in MOTORES.items():
+                    if (limite is not None and n > limite) or (suportados is not None and alfabeto not in suportados):
+                        continue
+                    r = medir(motor, texto, padroes, alfabeto)
+                    ocorrencias = sum(len(v) for v in r["resultados"].values())
+                    if referencia is None:
+                        referencia = r["resultados"]
+                    assert r["resultados"] == referencia, f"{motor} difere dos restantes motores"
+                    nome_alfabeto = "DNA" if alfabeto == DNA else "proteína" if alfabeto == PROTEINA else alfabeto
+                    print(f"{motor:<16}{nome_alfabeto:>9}{n:>9}{m:>5}{_formatar(r['construcao']):>13}"
+                          f"{_formatar(r['latencia'], 1e3):>15}{_formatar(r['debito'], 1e-6):>16}"
+                          f"{_formatar(r['memoria'], 1 / 2 ** 20):>14}{ocorrencias:>8}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Comparação dos motores de procura de padrões.")
+    parser.add_argument("--tamanhos", type = int, nargs = "+", default = [1_000, 5_000, 100_000])
+    parser.add_argument("--padroes", type = int, nargs = "+", default = [8, 32])
+    parser.add_argument("--alfabetos", nargs = "+", default = [DNA, PROTEINA])
+    parser.add_argument("--consultas", type = int, default = 10)
+    parser.add_argument("--semente", type = int, default = 42)
+    args = parser.parse_args()
+    main(args.tamanhos, args.padroes, args.alfabetos, args.consultas, args.semente)
@@ -3,6 +3,19 @@ Código base retirado dos powerpoints das aulas (da autoria de Rui Mendes) com p
 Utilização do stack overflow e de LLMs (GPT 3.5 e Gemini 1.5) para algumas correções
 """
 
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional, Sequence, Union, IO
+
+from utils.complemento import complemento_reverso
+
+from .BoyerMooreSet import BoyerMooreSet
+
+# Tamanho máximo por omissão dos fragmentos de search_pattern_parallel (4 MiB)
+_MAX_SHARD_SIZE = 1 << 22
+
 class BoyerMoore:
     """
     Implementação do algoritmo Boyer-Moore para busca de padrões em texto.
@@ -104,10 +117,43 @@ class BoyerMoore:
                 j = self.f[j]
 
         
+    def export_tables(self) -> dict:
+
+        """
+        Exporta as tabelas pré-processadas num dicionário serializável com pickle.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            dict: Dicionário com o alfabeto, o padrão e as tabelas occ, f e s.
+        """
+
+        return {"alphabet": self.alphabet, "pattern": self.pattern, "occ": self.occ, "f": self.f, "s": self.s}
+
+    @classmethod
+    def from_tables(cls, tables : dict) -> "BoyerMoore":
+
+        """
+        Reconstrói um objeto a partir das tabelas exportadas, sem repetir o pré-processamento.
+
+        Parâmetros:
+            tables (dict): Dicionário devolvido por export_tables.
+
+        Retorna:
+            BoyerMoore: O objeto pronto a procurar o padrão.
+        """
+
+        bm = cls.__new__(cls)
+        bm.__dict__.update(tables)
+        return bm
+
     def search_pattern(self, text : str) -> list:
 
         """
         Procura o padrão na sequência fornecida .
+        Símbolos fora do alfabeto (por exemplo 'N') nunca coincidem com o padrão e fazem a janela
+        avançar para lá deles.
 
         Parâmetros:
             text (str): A sequência na qual o padrão será procurado.
@@ -127,9 +173,416 @@ class BoyerMoore:
                 i = i +self.s[0]
             else:
                 c = text[i + j]
-                i += max(self.s[j + 1], j - self.occ[c])
+                i += max(self.s[j + 1], j - self.occ.get(c, -1))
+        return res
+
+    def search_batch(self, reads : Union[Iterable[str], Iterable[bytes], str, bytes], offsets : Optional[Sequence[int]] = None) -> tuple:
+
+        """
+        Procura o padrão em muitas sequências curtas (leituras) com uma única chamada a search_pattern.
+
+        As leituras são concatenadas num único buffer, que é percorrido de uma só vez; as
+        ocorrências que atravessam a fronteira entre duas leituras são descartadas. O resultado
+        é devolvido em dois arrays paralelos em vez de uma lista por leitura.
+
+        Parâmetros:
+            reads (Iterable[str] | Iterable[bytes] | str | bytes): Iterável de leituras, ou um buffer com as
+                leituras já concatenadas; leituras em bytes são concatenadas em bytes (para BoyerMooreCompact).
+            offsets (Sequence[int]): Posição inicial de cada leitura no buffer; obrigatório se reads for um buffer.
+
+        Retorna:
+            tuple: Par de arrays (índice da leitura, posição na leitura), ordenados por leitura e posição.
+        """
+
+        if offsets is None:
+            offsets = array("Q")
+            parts = []
+            total = 0
+            for read in reads:
+                offsets.append(total)
+                parts.append(read)
+                total += len(read)
+            reads = ("" if not parts or isinstance(parts[0], str) else b"").join(parts)
+
+        read_ids = array("I")
+        positions = array("I")
+        m = len(self.pattern)
+        last = len(offsets) - 1
+        r = 0
+        for i in self.search_pattern(reads):
+            while r < last and offsets[r + 1] <= i:
+                r += 1
+            end = offsets[r + 1] if r < last else len(reads)
+            if i + m <= end:
+                read_ids.append(r)
+                positions.append(i - offsets[r])
+        return read_ids, positions
+
+    def search_both_strands(self, text : Union[str, bytes]) -> list:
+
+        """
+        Procura o padrão nas duas cadeias do DNA numa única passagem pelo texto.
+        O padrão e o seu complemento reverso são procurados em conjunto com BoyerMooreSet;
+        uma ocorrência do complemento reverso corresponde ao padrão na cadeia '-'.
+
+        Parâmetros:
+            text (str | bytes): A sequência (cadeia '+') na qual o padrão será procurado; bytes são descodificados em latin-1.
+
+        Retorna:
+            list: Lista de tuplos (posição, cadeia), com cadeia '+' ou '-', ordenada pela posição.
+        """
+
+        if not isinstance(text, str):
+            text = bytes(text).decode("latin-1")
+        bms = BoyerMooreSet(self.alphabet, [self.pattern, complemento_reverso(self.pattern)])
+        return [(i, "+" if pid == 0 else "-") for pid, i in bms.search_pattern(text)]
+
+    def search_pattern_approx(self, text : Union[str, bytes], k : int) -> list:
+
+        """
+        Procura o padrão na sequência admitindo até k substituições.
+
+        Pelo princípio do pombal, uma ocorrência com no máximo k diferenças contém pelo menos
+        uma das k + 1 partes do padrão sem diferenças. Cada parte é procurada com o Boyer-Moore
+        exato (da mesma classe que este) e as posições candidatas são depois verificadas contra
+        o padrão completo, na mesma representação do texto.
+
+        Parâmetros:
+            text (str | bytes): A sequência na qual o padrão será procurado; bytes apenas em BoyerMooreCompact.
+            k (int): Número máximo de substituições admitidas.
+
+        Retorna:
+            list: Lista ordenada de tuplos (posição, número de diferenças).
+
+        Raises:
+            ValueError: Se k for negativo.
+        """
+
+        if k < 0:
+            raise ValueError("O número de diferenças não pode ser negativo.")
+        if k == 0:
+            return [(i, 0) for i in self.search_pattern(text)]
+
+        pattern = self.pattern if isinstance(text, str) else self.pattern.encode("ascii")
+        m = len(pattern)
+        last = len(text) - m
+        if k >= m:
+            candidates = range(last + 1)
+        else:
+            candidates = set()
+            for offset, seed in self._seeds(k + 1):
+                for i in type(self)(self.alphabet, seed).search_pattern(text):
+                    if 0 <= i - offset <= last:
+                        candidates.add(i - offset)
+
+        res = []
+        for i in sorted(candidates):
+            mismatches = 0
+            for a, b in zip(pattern, text[i:i + m]):
+                if a != b:
+                    mismatches += 1
+                    if mismatches > k:
+                        break
+            if mismatches <= k:
+                res.append((i, mismatches))
+        return res
+
+    def _seeds(self, parts : int) -> list:
+
+        """
+        Divide o padrão em partes contíguas de tamanho aproximadamente igual.
+
+        Parâmetros:
+            parts (int): Número de partes.
+
+        Retorna:
+            list: Lista de tuplos (posição no padrão, parte).
+        """
+
+        size, extra = divmod(len(self.pattern), parts)
+        res = []
+        start = 0
+        for i in range(parts):
+            end = start + size + (1 if i < extra else 0)
+            res.append((start, self.pattern[start:end]))
+            start = end
+        return res
+
+    def search_pattern_stream(self, chunks : Union[Iterable[str], IO], chunk_size : int = 1 << 20) -> Iterator[int]:
+
+        """
+        Procura o padrão num texto fornecido por blocos, sem o carregar todo em memória.
+        Entre blocos consecutivos são mantidos len(pattern) - 1 caracteres de sobreposição,
+        pelo que as ocorrências que atravessam a fronteira entre blocos são encontradas.
+
+        Parâmetros:
+            chunks (Iterable[str] | IO): Iterável de blocos de texto ou ficheiro aberto para leitura.
+            chunk_size (int): Tamanho dos blocos lidos quando é fornecido um ficheiro. Padrão é 1 MiB.
+
+        Retorna:
+            Iterator[int]: Gerador dos índices (no texto completo) onde o padrão foi encontrado.
+        """
+
+        if hasattr(chunks, "read"):
+            chunks = _read_chunks(chunks, chunk_size)
+
+        overlap = len(self.pattern) - 1
+        offset = 0 #posicao no texto completo do inicio do buffer
+        carry = ""
+        for chunk in chunks:
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode()
+            buffer = carry + chunk
+            for i in self.search_pattern(buffer):
+                yield offset + i
+            cut = max(0, len(buffer) - overlap)
+            carry = buffer[cut:]
+            offset += cut
+
+    def search_fasta(self, fasta, record : int = 0, chunk_size : int = 1 << 20) -> Iterator[int]:
+
+        """
+        Procura o padrão num registo de um ficheiro FASTA mapeado em memória (utils.FastaMmap).
+        Os cabeçalhos e as quebras de linha são ignorados através do índice de linhas do
+        ficheiro, e apenas um bloco de chunk_size nucleótidos é descodificado de cada vez.
+        Cada bloco é convertido para maiúsculas (as minúsculas de regiões mascaradas coincidem
+        com o padrão) e símbolos fora do alfabeto, como 'N', contam como falha, tal como em
+        Automato.encontrar_ocorrencias_fasta.
+
+        Parâmetros:
+            fasta (FastaMmap): O ficheiro FASTA indexado.
+            record (int): Índice do registo onde procurar. Padrão é 0.
+            chunk_size (int): Número de nucleótidos por bloco. Padrão é 1 MiB.
+
+        Retorna:
+            Iterator[int]: Gerador dos índices (na sequência do registo) onde o padrão foi encontrado.
+        """
+
+        return self.search_pattern_stream(bloco.upper() for bloco in fasta.blocos(chunk_size, record))
+
+    def search_pattern_parallel(self, text : str, workers : Optional[int] = None, shard_size : Optional[int] = None) -> list:
+
+        """
+        Procura o padrão na sequência dividindo-a por vários processos.
+
+        O texto é dividido em fragmentos de shard_size posições iniciais, cada um estendido com
+        len(pattern) - 1 caracteres do fragmento seguinte, de modo que cada ocorrência é
+        encontrada exatamente num fragmento. As tabelas pré-processadas são enviadas uma única
+        vez para cada processo, e são mantidos no máximo 2 * workers fragmentos pendentes; com o
+        shard_size por omissão (no máximo 4 MiB) as cópias pendentes ocupam no máximo
+        2 * workers * 4 MiB, independentemente do tamanho do texto.
+
+        Parâmetros:
+            text (str): A sequência na qual o padrão será procurado.
+            workers (int): Número de processos. Padrão é o número de CPUs.
+            shard_size (int): Número de posições iniciais por fragmento. Padrão divide o texto em 4 fragmentos
+                              por processo, com no máximo 4 MiB cada.
+
+        Retorna:
+            list: Lista ordenada de índices onde o padrão foi encontrado na sequência.
+        """
+
+        workers = workers or os.cpu_count() or 1
+        if shard_size is None:
+            shard_size = min(-(-len(text) // (4 * workers)), _MAX_SHARD_SIZE)
+        shard_size = max(shard_size, 1)
+        if workers == 1 or shard_size >= len(text):
+            return self.search_pattern(text)
+
+        overlap = len(self.pattern) - 1
+        res = []
+        with ProcessPoolExecutor(max_workers = workers, initializer = _init_worker, initargs = (self,)) as executor:
+            pending = deque()
+            for start in range(0, len(text), shard_size):
+                pending.append(executor.submit(_search_shard, text[start:start + shard_size + overlap], start))
+                if len(pending) >= 2 * workers:
+                    res.extend(pending.popleft().result())
+            while pending:
+                res.extend(pending.popleft().result())
         return res
 
+class BoyerMooreCompact(BoyerMoore):
+    """
+    Variante do Boyer-Moore com tabelas compiladas em arrays de inteiros, que procura sobre bytes.
+
+    Cada símbolo é codificado pelo seu valor de byte, pelo que a tabela de mau caractere é um
+    array indexado diretamente pelos bytes do texto. As regras de mau caractere e de bom sufixo
+    são combinadas numa única tabela de saltos, evitando o dicionário e o max() por cada falha.
+
+    Atributos:
+        pattern_bytes (bytes): O padrão codificado em ASCII.
+        occ (array): Última posição de cada byte no padrão (-1 se não ocorrer), com 256 entradas.
+        f (array): Informação do pré-processamento do bom sufixo.
+        s (array): Informação do pré-processamento do bom sufixo.
+        shift (array): Salto para cada par (posição da falha no padrão, byte do texto), em shift[j * 256 + byte].
+    """
+
+    def preprocess(self) -> None:
+
+        """
+        Realiza o pré-processamento do padrão e compila a tabela de saltos combinada.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        self.pattern_bytes = self.pattern.encode("ascii")
+        super().preprocess()
+        self.process_shift()
+
+    def process_bcr(self) -> None:
+
+        """
+        Implementação do pre-processamento do bad caracter rule sobre os bytes do padrão.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        self.occ = array("i", [-1]) * 256
+        for i, c in enumerate(self.pattern_bytes):
+            self.occ[c] = i
+
+    def process_gsr(self) -> None:
+
+        """
+        Implementação do pre-processamento do good suffix rule, guardado em arrays.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        super().process_gsr()
+        self.f = array("i", self.f)
+        self.s = array("i", self.s)
+
+    def process_shift(self) -> None:
+
+        """
+        Combina as duas regras numa tabela com o salto para cada posição de falha e byte do texto.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        self.shift = array("i", bytes(4 * 256 * len(self.pattern_bytes)))
+        for j in range(len(self.pattern_bytes)):
+            gs = self.s[j + 1]
+            for c in range(256):
+                self.shift[(j << 8) | c] = max(gs, j - self.occ[c])
+
+    def export_tables(self) -> dict:
+
+        """
+        Exporta as tabelas pré-processadas, incluindo a tabela de saltos combinada.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            dict: Dicionário com o alfabeto, o padrão e as tabelas occ, f, s e shift.
+        """
+
+        tables = super().export_tables()
+        tables["pattern_bytes"] = self.pattern_bytes
+        tables["shift"] = self.shift
+        return tables
+
+    def search_pattern(self, text : Union[bytes, str]) -> list:
+
+        """
+        Procura o padrão na sequência fornecida.
+
+        Parâmetros:
+            text (bytes | str): A sequência na qual o padrão será procurado; pode ser bytes, bytearray, mmap ou str ASCII.
+
+        Retorna:
+            list: Lista de índices onde o padrão foi encontrado na sequência.
+        """
+
+        if isinstance(text, str):
+            text = text.encode("ascii")
+        pattern = self.pattern_bytes
+        shift = self.shift
+        m = len(pattern)
+        s0 = self.s[0]
+        res = []
+        i = 0
+        last = len(text) - m
+        while i <= last:
+            j = m - 1
+            while j >= 0 and pattern[j] == text[j + i]:
+                j -= 1
+            if j < 0:
+                res.append(i)
+                i += s0
+            else:
+                i += shift[(j << 8) | text[i + j]]
+        return res
+
+_worker_bm = None
+
+def _init_worker(bm : BoyerMoore) -> None:
+
+    """
+    Guarda no processo de trabalho o objeto BoyerMoore já pré-processado.
+
+    Parâmetros:
+        bm (BoyerMoore): O objeto com as tabelas do padrão.
+
+    Retorna:
+        None
+    """
+
+    global _worker_bm
+    _worker_bm = bm
+
+def _search_shard(shard : str, start : int) -> list:
+
+    """
+    Procura o padrão num fragmento do texto, no processo de trabalho.
+
+    Parâmetros:
+        shard (str): O fragmento do texto.
+        start (int): A posição do fragmento no texto completo.
+
+    Retorna:
+        list: Lista de índices (no texto completo) onde o padrão foi encontrado.
+    """
+
+    return [start + i for i in _worker_bm.search_pattern(shard)]
+
+def _read_chunks(file : IO, chunk_size : int) -> Iterator[str]:
+
+    """
+    Lê um ficheiro em blocos de tamanho fixo.
+
+    Parâmetros:
+        file (IO): Ficheiro aberto para leitura (modo texto ou binário).
+        chunk_size (int): Número de caracteres (ou bytes) lidos de cada vez.
+
+    Retorna:
+        Iterator[str]: Gerador dos blocos lidos.
+    """
+
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
 def test():
 
     """
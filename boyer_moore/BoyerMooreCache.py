@@ -0,0 +1,138 @@
+"""
+Cache LRU de padrões pré-processados para o algoritmo Boyer-Moore.
+"""
+
+from collections import OrderedDict
+
+from .BoyerMoore import BoyerMoore
+
+class BoyerMooreCache:
+    """
+    Cache de objetos BoyerMoore já pré-processados, indexada por (alfabeto, padrão).
+
+    Quando a cache está cheia, é descartada a entrada usada há mais tempo.
+
+    Atributos:
+        maxsize (int): Número máximo de padrões guardados.
+        engine (type): Classe usada para construir os objetos (BoyerMoore ou uma subclasse).
+        hits (int): Número de pedidos servidos pela cache.
+        misses (int): Número de pedidos que obrigaram a pré-processar o padrão.
+    """
+
+    def __init__(self, maxsize : int = 128, engine : type = BoyerMoore) -> None:
+
+        """
+        Inicia uma cache vazia.
+
+        Parâmetros:
+            maxsize (int): Número máximo de padrões guardados. Padrão é 128.
+            engine (type): Classe usada para construir os objetos. Padrão é BoyerMoore.
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se maxsize não for positivo.
+        """
+
+        if maxsize < 1:
+            raise ValueError("O tamanho da cache tem de ser positivo.")
+        self.maxsize = maxsize
+        self.engine = engine
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, alphabet : str, pattern : str) -> BoyerMoore:
+
+        """
+        Devolve o objeto pré-processado para o padrão, construindo-o apenas se não estiver na cache.
+
+        Parâmetros:
+            alphabet (str): O alfabeto permitido nos padrões e sequências.
+            pattern (str): O padrão que será procurado.
+
+        Retorna:
+            BoyerMoore: O objeto com as tabelas do padrão.
+        """
+
+        key = (alphabet, pattern)
+        bm = self._entries.get(key)
+        if bm is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return bm
+        self.misses += 1
+        bm = self.engine(alphabet, pattern)
+        self._store(key, bm)
+        return bm
+
+    def export_tables(self) -> list:
+
+        """
+        Exporta as tabelas de todos os padrões em cache, da entrada mais antiga para a mais recente.
+        O resultado pode ser serializado com pickle e carregado noutro processo com load_tables.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            list: Lista de dicionários devolvidos por export_tables de cada objeto.
+        """
+
+        return [bm.export_tables() for bm in self._entries.values()]
+
+    def load_tables(self, tables : list) -> None:
+
+        """
+        Carrega tabelas exportadas para a cache, sem repetir o pré-processamento.
+
+        Parâmetros:
+            tables (list): Lista de dicionários devolvida por export_tables.
+
+        Retorna:
+            None
+        """
+
+        for t in tables:
+            self._store((t["alphabet"], t["pattern"]), self.engine.from_tables(t))
+
+    def clear(self) -> None:
+
+        """
+        Esvazia a cache e repõe os contadores.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _store(self, key : tuple, bm : BoyerMoore) -> None:
+
+        """
+        Guarda um objeto na cache, descartando a entrada mais antiga se necessário.
+
+        Parâmetros:
+            key (tuple): O par (alfabeto, padrão).
+            bm (BoyerMoore): O objeto pré-processado.
+
+        Retorna:
+            None
+        """
+
+        self._entries[key] = bm
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last = False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key : tuple) -> bool:
+        return key in self._entries
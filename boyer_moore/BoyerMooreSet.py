@@ -0,0 +1,177 @@
+"""
+Extensão do algoritmo Boyer-Moore a um conjunto de padrões (abordagem de Wu-Manber).
+As tabelas de deslocamento generalizam a bad character rule e a good suffix rule
+da classe BoyerMoore a blocos de q caracteres partilhados por todos os padrões.
+"""
+
+from typing import Optional
+
+class BoyerMooreSet:
+    """
+    Procura simultânea de vários padrões numa única passagem pelo texto.
+
+    Atributos:
+        alphabet (str): O alfabeto permitido nos padrões e sequências.
+        patterns (list): Lista de padrões a procurar; o índice de cada padrão é o seu identificador.
+        lmin (int): Comprimento do padrão mais curto, que define o tamanho da janela de procura.
+        block (int): Tamanho dos blocos (q-gramas) usados nas tabelas de deslocamento.
+        shift (dict): Deslocamento associado a cada bloco no fim da janela (bad character rule).
+        shift_match (dict): Deslocamento a aplicar depois de verificar os candidatos (good suffix rule).
+        hash (dict): Dicionário que mapeia o último bloco da janela para os padrões candidatos.
+    """
+
+    def __init__(self, alphabet : str, patterns : list, block : Optional[int] = None) -> None:
+
+        """
+        Inicia a classe BoyerMooreSet com o alfabeto e os padrões fornecidos.
+
+        Parâmetros:
+            alphabet (str): O alfabeto permitido nos padrões e sequências.
+            patterns (list): Lista de padrões que serão procurados na sequência.
+            block (int): Tamanho dos blocos usados nas tabelas de deslocamento. Padrão é o calculado
+                         por tamanho_bloco, que cresce com o número de padrões.
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se a lista de padrões for vazia ou contiver padrões vazios.
+        """
+
+        if not patterns:
+            raise ValueError("A lista de padrões não pode ser vazia.")
+        if not all(patterns):
+            raise ValueError("Os padrões não podem ser vazios.")
+        if block is not None and block < 1:
+            raise ValueError("O tamanho do bloco tem de ser positivo.")
+
+        self.alphabet = alphabet
+        self.patterns = list(patterns)
+        self.lmin = min(len(p) for p in self.patterns)
+        if block is None:
+            block = self.tamanho_bloco(len(alphabet), self.lmin, len(self.patterns))
+        self.block = min(block, self.lmin)
+        self.preprocess()
+
+    @staticmethod
+    def tamanho_bloco(sigma : int, lmin : int, num_padroes : int) -> int:
+
+        """
+        Calcula o tamanho dos blocos como em Wu-Manber: o menor q com sigma^q >= 2 * lmin * num_padroes.
+        Os padrões contêm no máximo lmin * num_padroes blocos distintos, pelo que a maior parte
+        dos sigma^q blocos possíveis não ocorre e permite o salto máximo.
+
+        Parâmetros:
+            sigma (int): O tamanho do alfabeto.
+            lmin (int): Comprimento do padrão mais curto.
+            num_padroes (int): Número de padrões.
+
+        Retorna:
+            int: O tamanho dos blocos, entre 1 e lmin.
+        """
+
+        sigma = max(sigma, 2)
+        q = 1
+        while q < lmin and sigma ** q < 2 * lmin * num_padroes:
+            q += 1
+        return q
+
+    def preprocess(self) -> None:
+
+        """
+        Realiza o pré-processamento dos padrões para construir as tabelas de deslocamento e de candidatos.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        self.process_bcr()
+        self.process_gsr()
+
+    def process_bcr(self) -> None:
+
+        """
+        Implementação do pre-processamento do bad caracter rule para o conjunto de padrões.
+        Cada bloco recebe a menor distância entre a sua última ocorrência no prefixo de
+        tamanho lmin de algum padrão e o fim da janela; blocos ausentes permitem saltar
+        lmin - block + 1 posições.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        q = self.block
+        self.default_shift = self.lmin - q + 1
+        self.shift = {}
+        self.hash = {}
+        for pid, p in enumerate(self.patterns):
+            prefixo = p[:self.lmin]
+            for fim in range(q, self.lmin + 1):
+                bloco = prefixo[fim - q:fim]
+                dist = self.lmin - fim
+                if dist < self.shift.get(bloco, self.default_shift):
+                    self.shift[bloco] = dist
+            self.hash.setdefault(prefixo[-q:], []).append(pid)
+
+    def process_gsr(self) -> None:
+
+        """
+        Implementação do pre-processamento do good suffix rule para o conjunto de padrões.
+        Depois de verificar uma janela cujo último bloco coincide com algum padrão, o
+        deslocamento seguro é a distância à ocorrência anterior desse bloco em qualquer padrão.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        q = self.block
+        self.shift_match = {}
+        for p in self.patterns:
+            prefixo = p[:self.lmin]
+            for fim in range(q, self.lmin):
+                bloco = prefixo[fim - q:fim]
+                dist = self.lmin - fim
+                if dist < self.shift_match.get(bloco, self.default_shift):
+                    self.shift_match[bloco] = dist
+
+    def search_pattern(self, text : str) -> list:
+
+        """
+        Procura todos os padrões na sequência fornecida numa única passagem.
+
+        Parâmetros:
+            text (str): A sequência na qual os padrões serão procurados.
+
+        Retorna:
+            list: Lista de tuplos (pattern_id, posição), ordenada pela posição.
+        """
+
+        res = []
+        q = self.block
+        i = self.lmin - 1 #fim da janela no texto
+        while i < len(text):
+            bloco = text[i - q + 1:i + 1]
+            salto = self.shift.get(bloco, self.default_shift)
+            if salto:
+                i += salto
+                continue
+            inicio = i - self.lmin + 1
+            for pid in self.hash.get(bloco, ()):
+                if text.startswith(self.patterns[pid], inicio):
+                    res.append((pid, inicio))
+            i += self.shift_match.get(bloco, self.default_shift)
+        return res
+
+
+if __name__ == "__main__":
+    bms = BoyerMooreSet("ACTG", ["ACCA", "ATG", "CCAT"])
+    print (bms.search_pattern("ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"))
@@ -1 +1,6 @@
-from bwt import *
\ No newline at end of file
+from .bwt import *
+from .bwt_compacta import BWTCompacta
+from .bwt_multipla import BWTMultipla
+from .fm_index import FMIndex
+from .compressao import comprimir, descomprimir, comprimir_fluxo, descomprimir_fluxo
+from .paralelo import bwt_lote
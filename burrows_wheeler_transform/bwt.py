@@ -3,10 +3,105 @@ Código base retirado dos powerpoints das aulas (da autoria de Rui Mendes) com p
 Utilização do stack overflow e de LLMs (GPT 3.5/ BlackboxAI) para algumas correções
 """
 
+from array import array
+from itertools import accumulate
+
+def suffix_array(seq : str) -> array:
+    """
+    Constrói o array de sufixos de uma sequência por duplicação de prefixos.
+
+    Os sufixos começam por ser agrupados pelos primeiros t caracteres, codificados num inteiro
+    (com t tal que o número de códigos possíveis não excede n). Em cada ronda os sufixos são
+    ordenados pelos seus primeiros 2k caracteres a partir da ordem pelos primeiros k. A ordem
+    pelo segundo bloco de k caracteres obtém-se diretamente do array da ronda anterior, e uma
+    passagem de ordenação por contagem (estável) pelo primeiro bloco completa a ronda, pelo que
+    cada ronda custa O(n). O grupo de cada sufixo é representado pela posição no array do
+    primeiro sufixo do grupo. São necessárias no máximo log2(n) rondas, pelo que o tempo é
+    O(n log n); a memória é O(n), em arrays de inteiros.
+
+    Parâmetros:
+        seq (str): A sequência de entrada.
+
+    Retorna:
+        array: As posições iniciais dos sufixos, por ordem lexicográfica.
+    """
+
+    n = len(seq)
+    simbolos = {c: i + 1 for i, c in enumerate(sorted(set(seq)))}
+    base = len(simbolos) + 1
+    t = 1
+    while base ** (t + 1) <= n:
+        t += 1
+
+    # Código dos primeiros t caracteres de cada sufixo (0 depois do fim), da direita para a esquerda
+    codigo = array('q', bytes(8 * n))
+    topo = base ** (t - 1)
+    c = 0
+    for i in range(n - 1, -1, -1):
+        c = c // base + simbolos[seq[i]] * topo
+        codigo[i] = c
+
+    # Ordenação por contagem pelo código (no máximo base ** t <= n códigos distintos)
+    livre = array('q', bytes(8 * (base ** t + 1)))
+    for c in codigo:
+        livre[c + 1] += 1
+    livre = array('q', accumulate(livre))
+    sa = array('i', bytes(4 * n))
+    for i, c in enumerate(codigo):
+        sa[livre[c]] = i
+        livre[c] += 1
+    del livre
+
+    grupo = array('i', bytes(4 * n))
+    grupos = 0
+    anterior = -1
+    for i in range(n):
+        j = sa[i]
+        if codigo[j] != anterior:
+            anterior = codigo[j]
+            inicio = i
+            grupos += 1
+        grupo[j] = inicio
+    del codigo
+
+    k = t
+    while grupos < n:
+        # Ordem pelo segundo bloco: os sufixos sem segundo bloco (já distintos) e depois os j - k, pela ordem de j
+        segundo = array('i', range(n - k, n))
+        segundo.extend(j - k for j in sa if j >= k)
+
+        # Ordenação por contagem pelo primeiro bloco: cada grupo ocupa as posições a partir do seu início
+        livre = array('i', range(n))
+        for j in segundo:
+            g = grupo[j]
+            sa[livre[g]] = j
+            livre[g] += 1
+        del segundo, livre
+
+        # Novos grupos: sufixos consecutivos com o mesmo par (primeiro bloco, segundo bloco)
+        novo = array('i', bytes(4 * n))
+        anterior = -1
+        grupos = 0
+        for i in range(n):
+            j = sa[i]
+            chave = grupo[j] * (n + 1) + (grupo[j + k] + 1 if j + k < n else 0)
+            if chave != anterior:
+                anterior = chave
+                inicio = i
+                grupos += 1
+            novo[j] = inicio
+        grupo = novo
+        k *= 2
+    return sa
+
 def bwt_transf(seq : str) -> str:
     """
     Realiza a transformação de Burrows-Wheeler em uma sequência dada.
 
+    A ordem das rotações de seq + '$' coincide com a ordem dos seus sufixos, porque o
+    terminador '$' é único, pelo que a transformação é obtida do array de sufixos sem
+    materializar as rotações. A sequência não deve conter o caractere '$'.
+
     Parâmetros:
         seq (str): A sequência de entrada.
 
@@ -16,37 +111,61 @@ def bwt_transf(seq : str) -> str:
 
     # Adiciona o caractere de terminação '$' à sequência
     seq += '$'
-    
-    # Gera todas as rotações da sequência
-    rotations = [seq[i:] + seq[:i] for i in range(len(seq))]
-    # Ordena as rotações
-    rotations.sort()
 
-    # Concatena os últimos caracteres de cada rotação para formar a BWT
-    bwt = ''.join(rotation[-1] for rotation in rotations)
-    # Retorna a BWT e o índice original da sequência na lista de rotações
+    # Ordena os sufixos (equivalente a ordenar as rotações)
+    sa = suffix_array(seq)
 
-    return bwt, rotations.index(seq)
+    # O último caractere de cada rotação é o que precede o sufixo correspondente
+    bwt = ''.join(seq[i - 1] for i in sa)
+    # Retorna a BWT e o índice da rotação que começa na posição 0 (a sequência original)
+
+    return bwt, sa.index(0)
 
 def bwt_reverse(bwt : str) -> str:
     """
     Reverte a transformação de Burrows-Wheeler em uma sequência original.
-    
+
+    Usa o mapeamento LF (last-to-first): a ocorrência de ordem r do caractere c na última
+    coluna corresponde à ocorrência de ordem r de c na primeira coluna, isto é, à linha
+    C[c] + r, onde C[c] é o número de caracteres menores que c. Partindo da linha da
+    sequência original, cada passo LF recua uma posição na sequência, em O(n) no total.
+
     Parâmetros:
-        bwt (str): A sequência de Burrows-Wheeler.
-    
+        bwt (str | bytes | BWTCompacta): A sequência de Burrows-Wheeler.
+
     Retorna:
         str: A sequência original.
     """
 
-    # Cria uma lista vazia do tamanho da sequência BWT
-    table = [None] * len(bwt)
+    # Em bytes ou BWTCompacta os símbolos são os valores dos bytes
+    terminador = '$' if isinstance(bwt, str) else ord('$')
+
+    # Número de ocorrências de cada caractere
+    contagem = {}
+    for c in bwt:
+        contagem[c] = contagem.get(c, 0) + 1
+
+    # C[c]: número de caracteres menores que c (início de c na primeira coluna)
+    inicio = {}
+    total = 0
+    for c in sorted(contagem):
+        inicio[c] = total
+        total += contagem[c]
 
-    # Executa o processo inverso de construção da tabela
-    for _ in range(len(bwt)):
-        table = [bwt[i] + (table[i] if table[i] is not None else '') for i in range(len(bwt))]
-        table.sort()
+    # lf[i]: linha da primeira coluna correspondente à posição i da última coluna
+    lf = array('I', bytes(4 * len(bwt)))
+    for i, c in enumerate(bwt):
+        lf[i] = inicio[c]
+        inicio[c] += 1
 
-    # Retorna a sequência original encontrada na tabela na posição do caractere de terminação '$'
+    # A linha com '$' no fim é a sequência original; o passo LF seguinte dá a rotação '$' + seq,
+    # cujo último caractere é o último da sequência
+    res = []
+    r = lf[bwt.index(terminador)]
+    for _ in range(len(bwt) - 1):
+        res.append(bwt[r])
+        r = lf[r]
 
-    return table[bwt.index('$')][:-1]
+    if isinstance(bwt, str):
+        return ''.join(reversed(res))
+    return bytes(reversed(res)).decode('latin-1')
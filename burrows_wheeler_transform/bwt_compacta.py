@@ -0,0 +1,195 @@
+"""
+Representação compacta (2 bits por base) da transformada de Burrows-Wheeler de sequências de DNA.
+"""
+
+from array import array
+from typing import Iterator, Union
+
+_TERMINADOR = ord('$')
+_CODIGOS = {ord('A'): 0, ord('C'): 1, ord('G'): 2, ord('T'): 3}
+# O terminador é guardado como 'A' nos dados compactados e corrigido à parte
+_CODIFICACAO = bytes.maketrans(b'ACGT$', b'\x00\x01\x02\x03\x00')
+# _DESCOMPACTAR[b]: os quatro símbolos guardados no byte b
+_DESCOMPACTAR = [bytes(b'ACGT'[(b >> 2 * j) & 3] for j in range(4)) for b in range(256)]
+# _CONTAGEM[k]: tabela de tradução de cada byte para o número dos seus campos com o código k
+_CONTAGEM = [bytes(sum((b >> 2 * j) & 3 == k for j in range(4)) for b in range(256)) for k in range(4)]
+
+class BWTCompacta:
+    """
+    Transformada de Burrows-Wheeler de DNA guardada com 2 bits por base.
+
+    As bases A, C, G e T são compactadas quatro por byte e a posição do terminador '$' é
+    guardada à parte. A contagem (rank) de cada base usa pontos de controlo a cada
+    intervalo_rank posições e, dentro de um bloco, tabelas de contagem por byte. Cada ponto
+    guarda apenas as contagens de A, C e G; a de T é a posição menos as outras três. Com o
+    intervalo por omissão os pontos ocupam 12 / 1024 bytes por base, e o total fica perto
+    dos 0.25 bytes por base dos dados compactados.
+    O objeto comporta-se como os bytes da transformada: o índice e a iteração devolvem
+    o valor do byte de cada símbolo.
+
+    Atributos:
+        n (int): O tamanho da transformada.
+        terminador (int): A posição do '$'.
+        dados (bytes): As bases compactadas, quatro por byte (a primeira nos bits menos significativos).
+        intervalo_rank (int): Distância entre pontos de controlo (múltiplo de 4).
+        pontos (array): pontos[3 * j + k] é o número de bases com código k < 3 antes da posição j * intervalo_rank
+                        (o terminador conta como A).
+    """
+
+    def __init__(self, bwt : Union[str, bytes], intervalo_rank : int = 1024) -> None:
+        """
+        Compacta a transformada.
+
+        Parâmetros:
+            bwt (str | bytes): A transformada, com símbolos A, C, G, T e um único '$'.
+            intervalo_rank (int): Distância entre pontos de controlo, múltiplo de 4. Padrão é 1024.
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se a transformada tiver outros símbolos ou não tiver um único '$',
+                        ou se o intervalo não for um múltiplo positivo de 4.
+        """
+
+        if intervalo_rank < 4 or intervalo_rank % 4:
+            raise ValueError("O intervalo entre pontos de controlo tem de ser um múltiplo positivo de 4.")
+        if isinstance(bwt, str):
+            bwt = bwt.encode('latin-1')
+        if bwt.translate(None, b'ACGT$') or bwt.count(b'$') != 1:
+            raise ValueError("A transformada só pode conter A, C, G, T e um único '$'.")
+
+        self.n = len(bwt)
+        self.terminador = bwt.index(b'$')
+        self.intervalo_rank = intervalo_rank
+
+        # Cada byte de codigos[j::4] vale no máximo 3, pelo que deslocar o inteiro inteiro
+        # 2j bits coloca o campo j de todos os bytes de uma só vez
+        codigos = bwt.translate(_CODIFICACAO)
+        codigos += bytes(-len(codigos) % 4)
+        campos = [int.from_bytes(codigos[j::4], 'little') for j in range(4)]
+        compactado = campos[0] | campos[1] << 2 | campos[2] << 4 | campos[3] << 6
+        self.dados = compactado.to_bytes(len(codigos) // 4, 'little')
+        self.construir_pontos()
+
+    def construir_pontos(self) -> None:
+        """
+        Constrói os pontos de controlo das contagens de A, C e G.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        passo = self.intervalo_rank // 4
+        totais = [0, 0, 0]
+        self.pontos = array('I')
+        for inicio in range(0, len(self.dados), passo):
+            self.pontos.extend(totais)
+            bloco = self.dados[inicio:inicio + passo]
+            for k in range(3):
+                totais[k] += sum(bloco.translate(_CONTAGEM[k]))
+        self.pontos.extend(totais)
+
+    def rank(self, c : int, i : int) -> int:
+        """
+        Conta as ocorrências do símbolo c em bwt[:i].
+
+        Parâmetros:
+            c (int): O símbolo (valor do byte).
+            i (int): A posição final (exclusiva).
+
+        Retorna:
+            int: O número de ocorrências.
+        """
+
+        if c == _TERMINADOR:
+            return 1 if i > self.terminador else 0
+        k = _CODIGOS.get(c)
+        if k is None:
+            return 0
+
+        j = i // self.intervalo_rank
+        byte = i >> 2
+        if k == 3:
+            total = j * self.intervalo_rank - sum(self.pontos[3 * j:3 * j + 3])
+        else:
+            total = self.pontos[3 * j + k]
+        total += sum(self.dados[j * (self.intervalo_rank // 4):byte].translate(_CONTAGEM[k]))
+        for campo in range(i & 3):
+            if (self.dados[byte] >> 2 * campo) & 3 == k:
+                total += 1
+        if k == 0 and self.terminador < i:
+            total -= 1
+        return total
+
+    def count(self, c : int) -> int:
+        """
+        Conta as ocorrências do símbolo c na transformada.
+
+        Parâmetros:
+            c (int): O símbolo (valor do byte).
+
+        Retorna:
+            int: O número de ocorrências.
+        """
+
+        return self.rank(c, self.n)
+
+    def index(self, c : Union[int, str, bytes]) -> int:
+        """
+        Devolve a posição da primeira ocorrência de um símbolo.
+
+        Parâmetros:
+            c (int | str | bytes): O símbolo.
+
+        Retorna:
+            int: A posição do símbolo.
+
+        Raises:
+            ValueError: Se o símbolo não ocorrer.
+        """
+
+        if not isinstance(c, int):
+            c = ord(c)
+        if c == _TERMINADOR:
+            return self.terminador
+        return bytes(self).index(c)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Número de bytes ocupados pelos dados compactados e pelos pontos de controlo.
+        """
+
+        return len(self.dados) + self.pontos.itemsize * len(self.pontos)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i : int) -> int:
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("Posição fora da transformada.")
+        if i == self.terminador:
+            return _TERMINADOR
+        return b'ACGT'[(self.dados[i >> 2] >> 2 * (i & 3)) & 3]
+
+    def __iter__(self) -> Iterator[int]:
+        pos = 0
+        for inicio in range(0, len(self.dados), 4096):
+            bloco = bytearray(b''.join(map(_DESCOMPACTAR.__getitem__, self.dados[inicio:inicio + 4096])))
+            del bloco[self.n - pos:]
+            if pos <= self.terminador < pos + len(bloco):
+                bloco[self.terminador - pos] = _TERMINADOR
+            pos += len(bloco)
+            yield from bloco
+
+    def __bytes__(self) -> bytes:
+        return bytes(iter(self))
+
+    def __str__(self) -> str:
+        return bytes(self).decode('latin-1')
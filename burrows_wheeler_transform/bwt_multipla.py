@@ -0,0 +1,321 @@
+"""
+Transformada de Burrows-Wheeler de uma coleção de sequências, construída de forma incremental.
+"""
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+_TERMINADOR = ord('$')
+# Número mínimo de filhos de cada nodo interno (exceto a raiz); o máximo é o dobro
+_RAMOS = 32
+
+class _No:
+    """
+    Nodo interno da árvore B+ que guarda a transformada.
+
+    Atributos:
+        filhos (list): Os filhos (nodos internos ou blocos bytearray).
+        tamanhos (list): O número de símbolos abaixo de cada filho.
+        contagens (dict): Para cada símbolo, lista com o seu número de ocorrências abaixo de cada filho.
+    """
+
+    __slots__ = ('filhos', 'tamanhos', 'contagens')
+
+    def __init__(self, filhos : list, tamanhos : list, contagens : dict) -> None:
+        self.filhos = filhos
+        self.tamanhos = tamanhos
+        self.contagens = contagens
+
+def _tamanho(no : Union[_No, bytearray]) -> int:
+    """
+    Número de símbolos abaixo de um nodo.
+    """
+
+    return sum(no.tamanhos) if isinstance(no, _No) else len(no)
+
+def _contar(no : Union[_No, bytearray], c : int) -> int:
+    """
+    Número de ocorrências do símbolo c abaixo de um nodo.
+    """
+
+    return sum(no.contagens.get(c, ())) if isinstance(no, _No) else no.count(c)
+
+def _escolher(no : _No, i : int) -> Tuple[int, int]:
+    """
+    Escolhe o filho de um nodo que contém a posição i (0 <= i <= tamanho do nodo).
+
+    Parâmetros:
+        no (_No): O nodo.
+        i (int): A posição abaixo do nodo.
+
+    Retorna:
+        tuple: (índice do filho, posição abaixo do filho); a posição final fica no último filho.
+    """
+
+    acumulados = list(accumulate(no.tamanhos))
+    k = min(bisect_right(acumulados, i), len(acumulados) - 1)
+    return k, i - (acumulados[k - 1] if k else 0)
+
+class BWTMultipla:
+    """
+    Transformada de Burrows-Wheeler de uma coleção de sequências, que pode crescer sem ser reconstruída.
+
+    Cada sequência termina num terminador próprio; os terminadores são todos representados por '$'
+    na transformada, mas ordenam-se pela ordem de inserção das sequências ($_0 < $_1 < ...) e antes
+    de qualquer outro símbolo. Assim, a linha i é a do sufixo $_i e a transformada de uma única
+    sequência é igual à devolvida por bwt_transf.
+
+    Para acrescentar uma sequência s de tamanho m, os seus sufixos são inseridos do mais curto para
+    o mais longo: o sufixo $_N fica na linha N (N sequências já inseridas) e, depois de inserir
+    s[i] na linha k do sufixo s[i + 1:], o sufixo s[i:] fica na linha C(s[i]) + 1 + rank(s[i], k).
+
+    A transformada é guardada numa árvore B+ cujas folhas são blocos (bytearray) de tamanho_bloco a
+    2 * tamanho_bloco símbolos; cada nodo interno tem entre _RAMOS e 2 * _RAMOS filhos e guarda o
+    tamanho e o número de cada símbolo abaixo de cada filho. Uma consulta de rank ou uma inserção
+    desce um caminho da raiz a um bloco, e a divisão de um bloco ou de um nodo só altera os nodos
+    desse caminho, pelo que acrescentar m símbolos custa O(m log n), independentemente do tamanho
+    da coleção.
+
+    Atributos:
+        n (int): O tamanho da transformada.
+        n_seqs (int): O número de sequências.
+        tamanho_bloco (int): O tamanho mínimo de cada bloco (exceto se houver apenas um).
+        raiz (_No): A raiz da árvore.
+        totais (array): totais[c] é o número de ocorrências do símbolo c.
+    """
+
+    def __init__(self, seqs : Iterable[str] = (), tamanho_bloco : int = 4096) -> None:
+        """
+        Cria a transformada, opcionalmente com um lote de sequências.
+
+        Parâmetros:
+            seqs (Iterable[str]): As sequências iniciais. Padrão é nenhuma.
+            tamanho_bloco (int): O tamanho mínimo de cada bloco. Padrão é 4096.
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se o tamanho do bloco não for positivo.
+        """
+
+        if tamanho_bloco < 1:
+            raise ValueError("O tamanho do bloco tem de ser positivo.")
+        self.tamanho_bloco = tamanho_bloco
+        self.n = 0
+        self.n_seqs = 0
+        self.raiz = _No([bytearray()], [0], {})
+        self.totais = array('I', bytes(4 * 256))
+        self.adicionar_lote(seqs)
+
+    def _descer(self, i : int) -> Tuple[List[Tuple[_No, int]], bytearray, int]:
+        """
+        Desce da raiz até ao bloco que contém a linha i (0 <= i <= n).
+
+        Parâmetros:
+            i (int): A linha.
+
+        Retorna:
+            tuple: (caminho de pares (nodo, índice do filho), bloco, posição no bloco)
+        """
+
+        caminho = []
+        no = self.raiz
+        while isinstance(no, _No):
+            k, i = _escolher(no, i)
+            caminho.append((no, k))
+            no = no.filhos[k]
+        return caminho, no, i
+
+    def rank(self, c : int, i : int) -> int:
+        """
+        Conta as ocorrências do símbolo c nas linhas [0, i).
+
+        Parâmetros:
+            c (int): O símbolo (valor do byte).
+            i (int): A linha final (exclusiva).
+
+        Retorna:
+            int: O número de ocorrências.
+        """
+
+        if not self.totais[c]:
+            return 0
+        caminho, bloco, pos = self._descer(i)
+        # Um nodo sem a chave c não tem nenhum c abaixo (a chave só é criada ao inserir c)
+        total = sum(sum(no.contagens.get(c, ())[:k]) for no, k in caminho)
+        return total + bloco.count(c, 0, pos)
+
+    def _dividir(self, no : Union[_No, bytearray]) -> Optional[Tuple[Union[_No, bytearray], Union[_No, bytearray]]]:
+        """
+        Divide um bloco com mais de 2 * tamanho_bloco símbolos, ou um nodo com mais de 2 * _RAMOS filhos, ao meio.
+
+        Parâmetros:
+            no (_No | bytearray): O nodo ou bloco.
+
+        Retorna:
+            tuple: As duas metades, ou None se o nodo não tiver de ser dividido.
+        """
+
+        if isinstance(no, bytearray):
+            if len(no) <= 2 * self.tamanho_bloco:
+                return None
+            return no[:self.tamanho_bloco], no[self.tamanho_bloco:]
+        if len(no.filhos) <= 2 * _RAMOS:
+            return None
+        return (_No(no.filhos[:_RAMOS], no.tamanhos[:_RAMOS], {c: v[:_RAMOS] for c, v in no.contagens.items()}),
+                _No(no.filhos[_RAMOS:], no.tamanhos[_RAMOS:], {c: v[_RAMOS:] for c, v in no.contagens.items()}))
+
+    def _inserir(self, c : int, i : int) -> None:
+        """
+        Insere o símbolo c na linha i, atualizando as contagens do caminho e dividindo os nodos
+        que fiquem demasiado grandes, do bloco para a raiz.
+
+        Parâmetros:
+            c (int): O símbolo (valor do byte).
+            i (int): A linha.
+
+        Retorna:
+            None
+        """
+
+        caminho, bloco, pos = self._descer(i)
+        bloco.insert(pos, c)
+        self.n += 1
+        self.totais[c] += 1
+        for no, k in caminho:
+            no.tamanhos[k] += 1
+            if c not in no.contagens:
+                no.contagens[c] = [0] * len(no.filhos)
+            no.contagens[c][k] += 1
+
+        filho = bloco
+        for no, k in reversed(caminho):
+            metades = self._dividir(filho)
+            if metades is None:
+                return
+            no.filhos[k:k + 1] = metades
+            no.tamanhos[k:k + 1] = [_tamanho(m) for m in metades]
+            for simbolo, por_filho in no.contagens.items():
+                por_filho[k:k + 1] = [_contar(m, simbolo) for m in metades]
+            filho = no
+
+        metades = self._dividir(self.raiz)
+        if metades is not None:
+            contagens = {s: [_contar(m, s) for m in metades] for s in self.raiz.contagens}
+            self.raiz = _No(list(metades), [_tamanho(m) for m in metades], contagens)
+
+    def _blocos(self) -> Iterator[bytearray]:
+        """
+        Percorre os blocos da transformada por ordem.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            Iterator[bytearray]: Gerador dos blocos.
+        """
+
+        pilha = [self.raiz]
+        while pilha:
+            no = pilha.pop()
+            if isinstance(no, _No):
+                pilha.extend(reversed(no.filhos))
+            else:
+                yield no
+
+    def adicionar(self, seq : str) -> None:
+        """
+        Acrescenta uma sequência à coleção, com o terminador seguinte aos já existentes.
+
+        Parâmetros:
+            seq (str): A sequência (apenas símbolos maiores que '$').
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se a sequência contiver '$' ou símbolos menores.
+        """
+
+        dados = seq.encode('latin-1')
+        if dados and min(dados) <= _TERMINADOR:
+            raise ValueError("As sequências só podem conter símbolos maiores que '$'.")
+
+        # Linha do sufixo $_N, a seguir aos terminadores existentes
+        k = self.n_seqs
+        for c in reversed(dados):
+            self._inserir(c, k)
+            # Símbolos menores que c (o $_N ainda não está na transformada) e os c das linhas anteriores
+            k = sum(self.totais[:c]) + 1 + self.rank(c, k)
+        self._inserir(_TERMINADOR, k)
+        self.n_seqs += 1
+
+    def adicionar_lote(self, seqs : Iterable[str]) -> None:
+        """
+        Acrescenta várias sequências à coleção, pela ordem dada.
+
+        Parâmetros:
+            seqs (Iterable[str]): As sequências.
+
+        Retorna:
+            None
+        """
+
+        for seq in seqs:
+            self.adicionar(seq)
+
+    def juntar(self, outra : "BWTMultipla") -> None:
+        """
+        Junta as sequências de outra transformada a esta, a seguir às existentes.
+        O custo depende apenas do tamanho da outra transformada.
+
+        Parâmetros:
+            outra (BWTMultipla): A transformada a juntar.
+
+        Retorna:
+            None
+        """
+
+        self.adicionar_lote(outra.sequencias())
+
+    def sequencias(self) -> Iterator[str]:
+        """
+        Recupera as sequências da coleção pelo mapeamento LF, começando na linha do terminador de cada uma.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            Iterator[str]: Gerador das sequências, pela ordem de inserção.
+        """
+
+        for i in range(self.n_seqs):
+            seq = bytearray()
+            r = i
+            c = self[r]
+            while c != _TERMINADOR:
+                seq.append(c)
+                r = sum(self.totais[:c]) + self.rank(c, r)
+                c = self[r]
+            seq.reverse()
+            yield seq.decode('latin-1')
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i : int) -> int:
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("Posição fora da transformada.")
+        _, bloco, pos = self._descer(i)
+        return bloco[pos]
+
+    def __bytes__(self) -> bytes:
+        return b''.join(self._blocos())
+
+    def __str__(self) -> str:
+        return bytes(self).decode('latin-1')
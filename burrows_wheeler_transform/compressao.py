@@ -0,0 +1,281 @@
+"""
+Compressão de sequências por blocos: transformada de Burrows-Wheeler, move-to-front,
+codificação das sequências de zeros e codificação de Huffman.
+
+Formato: a magia b'BWTZ' e um byte de versão, seguidos de blocos independentes, cada um
+com o tamanho (4 bytes, little-endian) e os dados comprimidos do bloco.
+"""
+
+import io
+import re
+import struct
+import zlib
+from typing import IO, Iterable, Iterator, Union
+
+from .bwt import bwt_transf, bwt_reverse
+from .paralelo import mapear_ordenado
+
+_MAGIA = b'BWTZ'
+_VERSAO = 1
+_TAMANHO = struct.Struct('<I')
+_ZEROS = re.compile(rb'\x00+')
+
+def mover_para_frente(dados : bytes) -> bytes:
+    """
+    Codificação move-to-front: cada byte é substituído pela sua posição numa lista de
+    símbolos, e passa para a frente da lista. As repetições da BWT tornam-se zeros.
+
+    Parâmetros:
+        dados (bytes): Os dados a codificar.
+
+    Retorna:
+        bytes: As posições de cada byte.
+    """
+
+    tabela = list(range(256))
+    res = bytearray(len(dados))
+    for i, c in enumerate(dados):
+        j = tabela.index(c)
+        res[i] = j
+        if j:
+            del tabela[j]
+            tabela.insert(0, c)
+    return bytes(res)
+
+def inverter_mover_para_frente(dados : bytes) -> bytes:
+    """
+    Inverte a codificação move-to-front.
+
+    Parâmetros:
+        dados (bytes): As posições devolvidas por mover_para_frente.
+
+    Retorna:
+        bytes: Os dados originais.
+    """
+
+    tabela = list(range(256))
+    res = bytearray(len(dados))
+    for i, j in enumerate(dados):
+        c = tabela[j]
+        res[i] = c
+        if j:
+            del tabela[j]
+            tabela.insert(0, c)
+    return bytes(res)
+
+def codificar_zeros(dados : bytes) -> bytes:
+    """
+    Codifica cada sequência de zeros como um zero seguido do seu comprimento menos um (varint).
+
+    Parâmetros:
+        dados (bytes): Os dados a codificar.
+
+    Retorna:
+        bytes: Os dados com as sequências de zeros comprimidas.
+    """
+
+    res = bytearray()
+    pos = 0
+    for seq in _ZEROS.finditer(dados):
+        res += dados[pos:seq.start()]
+        res.append(0)
+        resto = seq.end() - seq.start() - 1
+        while resto >= 0x80:
+            res.append(resto & 0x7f | 0x80)
+            resto >>= 7
+        res.append(resto)
+        pos = seq.end()
+    res += dados[pos:]
+    return bytes(res)
+
+def descodificar_zeros(dados : bytes) -> bytes:
+    """
+    Inverte codificar_zeros.
+
+    Parâmetros:
+        dados (bytes): Os dados codificados.
+
+    Retorna:
+        bytes: Os dados originais.
+    """
+
+    res = bytearray()
+    pos = 0
+    while pos < len(dados):
+        zero = dados.find(0, pos)
+        if zero < 0:
+            res += dados[pos:]
+            break
+        res += dados[pos:zero]
+        pos = zero + 1
+        comprimento = 0
+        deslocamento = 0
+        while True:
+            b = dados[pos]
+            pos += 1
+            comprimento |= (b & 0x7f) << deslocamento
+            deslocamento += 7
+            if b < 0x80:
+                break
+        res += bytes(comprimento + 1)
+    return bytes(res)
+
+def comprimir_bloco(bloco : str) -> bytes:
+    """
+    Comprime um bloco: BWT, move-to-front, sequências de zeros e Huffman (zlib em modo Z_HUFFMAN_ONLY).
+
+    Parâmetros:
+        bloco (str): O bloco de texto (sem o caractere '$').
+
+    Retorna:
+        bytes: O bloco comprimido.
+
+    Raises:
+        ValueError: Se o bloco contiver o caractere '$'.
+    """
+
+    if '$' in bloco:
+        raise ValueError("O texto a comprimir não pode conter o caractere '$'.")
+    bwt, _ = bwt_transf(bloco)
+    dados = codificar_zeros(mover_para_frente(bwt.encode('latin-1')))
+    huffman = zlib.compressobj(9, zlib.DEFLATED, -15, 9, zlib.Z_HUFFMAN_ONLY)
+    return huffman.compress(dados) + huffman.flush()
+
+def descomprimir_bloco(dados : bytes) -> str:
+    """
+    Descomprime um bloco produzido por comprimir_bloco.
+
+    Parâmetros:
+        dados (bytes): O bloco comprimido.
+
+    Retorna:
+        str: O bloco de texto original.
+    """
+
+    bwt = inverter_mover_para_frente(descodificar_zeros(zlib.decompress(dados, -15)))
+    return bwt_reverse(bwt.decode('latin-1'))
+
+def _reagrupar(fonte : Union[str, Iterable[str]], tamanho_bloco : int) -> Iterator[str]:
+    """
+    Divide o texto (ou um iterável de partes do texto) em blocos de tamanho_bloco caracteres.
+
+    Parâmetros:
+        fonte (str | Iterable[str]): O texto ou as suas partes.
+        tamanho_bloco (int): O tamanho dos blocos (o último pode ser menor).
+
+    Retorna:
+        Iterator[str]: Gerador dos blocos.
+    """
+
+    if isinstance(fonte, str):
+        fonte = (fonte,)
+    resto = ''
+    for parte in fonte:
+        resto += parte
+        inicio = 0
+        while len(resto) - inicio >= tamanho_bloco:
+            yield resto[inicio:inicio + tamanho_bloco]
+            inicio += tamanho_bloco
+        resto = resto[inicio:]
+    if resto:
+        yield resto
+
+def comprimir_fluxo(fonte : Union[str, Iterable[str]], saida : IO, tamanho_bloco : int = 1 << 18,
+                    processos : int = 1) -> int:
+    """
+    Comprime um texto, ou um iterável de partes de um texto, bloco a bloco para um ficheiro binário.
+    Apenas um número limitado de blocos está em memória de cada vez.
+
+    Parâmetros:
+        fonte (str | Iterable[str]): O texto ou as suas partes.
+        saida (IO): O ficheiro (binário) de saída.
+        tamanho_bloco (int): Número de caracteres por bloco. Padrão é 256 Ki.
+        processos (int): Número de processos que comprimem blocos em paralelo. Padrão é 1.
+
+    Retorna:
+        int: O número de bytes escritos.
+
+    Raises:
+        ValueError: Se o tamanho do bloco não for positivo.
+    """
+
+    if tamanho_bloco < 1:
+        raise ValueError("O tamanho do bloco tem de ser positivo.")
+    escritos = saida.write(_MAGIA + bytes([_VERSAO]))
+    for dados in mapear_ordenado(comprimir_bloco, _reagrupar(fonte, tamanho_bloco), processos):
+        escritos += saida.write(_TAMANHO.pack(len(dados)))
+        escritos += saida.write(dados)
+    return escritos
+
+def _ler_blocos(entrada : IO) -> Iterator[bytes]:
+    """
+    Lê os blocos comprimidos de um ficheiro produzido por comprimir_fluxo.
+
+    Parâmetros:
+        entrada (IO): O ficheiro (binário) de entrada.
+
+    Retorna:
+        Iterator[bytes]: Gerador dos blocos comprimidos.
+
+    Raises:
+        ValueError: Se o ficheiro não estiver no formato esperado.
+    """
+
+    if entrada.read(len(_MAGIA) + 1) != _MAGIA + bytes([_VERSAO]):
+        raise ValueError("Os dados não estão no formato BWTZ.")
+    while True:
+        cabecalho = entrada.read(_TAMANHO.size)
+        if not cabecalho:
+            return
+        if len(cabecalho) < _TAMANHO.size:
+            raise ValueError("Os dados comprimidos estão truncados.")
+        tamanho, = _TAMANHO.unpack(cabecalho)
+        dados = entrada.read(tamanho)
+        if len(dados) < tamanho:
+            raise ValueError("Os dados comprimidos estão truncados.")
+        yield dados
+
+def descomprimir_fluxo(entrada : IO, processos : int = 1) -> Iterator[str]:
+    """
+    Descomprime um ficheiro produzido por comprimir_fluxo, bloco a bloco.
+
+    Parâmetros:
+        entrada (IO): O ficheiro (binário) de entrada.
+        processos (int): Número de processos que descomprimem blocos em paralelo. Padrão é 1.
+
+    Retorna:
+        Iterator[str]: Gerador dos blocos de texto, pela ordem original.
+    """
+
+    return mapear_ordenado(descomprimir_bloco, _ler_blocos(entrada), processos)
+
+def comprimir(texto : str, tamanho_bloco : int = 1 << 18, processos : int = 1) -> bytes:
+    """
+    Comprime um texto em memória.
+
+    Parâmetros:
+        texto (str): O texto a comprimir (sem o caractere '$').
+        tamanho_bloco (int): Número de caracteres por bloco. Padrão é 256 Ki.
+        processos (int): Número de processos. Padrão é 1.
+
+    Retorna:
+        bytes: Os dados comprimidos.
+    """
+
+    saida = io.BytesIO()
+    comprimir_fluxo(texto, saida, tamanho_bloco, processos)
+    return saida.getvalue()
+
+def descomprimir(dados : bytes, processos : int = 1) -> str:
+    """
+    Descomprime dados produzidos por comprimir.
+
+    Parâmetros:
+        dados (bytes): Os dados comprimidos.
+        processos (int): Número de processos. Padrão é 1.
+
+    Retorna:
+        str: O texto original.
+    """
+
+    return ''.join(descomprimir_fluxo(io.BytesIO(dados), processos))
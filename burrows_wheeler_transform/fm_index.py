@@ -0,0 +1,529 @@
+"""
+Índice FM construído sobre a transformada de Burrows-Wheeler, com procura para trás (backward search).
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Optional, Union
+
+from .bwt import bwt_transf
+from .bwt_compacta import BWTCompacta
+
+# Cabeçalho do ficheiro: magia, versão, ordem dos bytes (0 little, 1 big), tipo da transformada
+# (0 um byte por símbolo, 1 BWTCompacta), n, intervalo_occ, taxa_sa, número de símbolos
+_CABECALHO = struct.Struct('<4sHBBQIII')
+# Início da secção Occ de uma BWTCompacta: posição do '$' e intervalo_rank, seguidos dos pontos de controlo
+_COMPACTA = struct.Struct('<QI4x')
+# Posições no ficheiro de: bwt, C, occ, marcas, rank_marcas, sa_amostras e fim do ficheiro
+_SECCOES = struct.Struct('<7Q')
+_MAGIA = b'FMIX'
+_VERSAO = 1
+
+class FMIndex:
+    """
+    Índice FM sobre a transformada de Burrows-Wheeler de uma sequência.
+
+    A contagem de um padrão de tamanho m faz m passos de procura para trás, cada um com
+    duas consultas de Occ, independentemente do tamanho da sequência.
+
+    Compromisso tempo/memória (n símbolos, σ símbolos distintos):
+        - Occ: σ pontos de controlo de 4 bytes a cada intervalo_occ linhas (4σn / intervalo_occ
+          bytes); cada consulta conta no máximo intervalo_occ bytes da transformada.
+        - SA: apenas os valores múltiplos de taxa_sa são guardados (4n / taxa_sa bytes), mais
+          um vetor de bits das linhas amostradas (n / 8 bytes). Cada ocorrência devolvida por
+          locate custa no máximo taxa_sa - 1 passos LF até chegar a uma linha amostrada.
+    Com os valores por omissão (64 e 32) e DNA, o índice ocupa cerca de 1.6 bytes por base,
+    incluindo a transformada. Com uma BWTCompacta a transformada passa a 2 bits por base e as
+    contagens usam os pontos de controlo da própria BWTCompacta (cerca de 0.5 bytes por base).
+
+    Atributos:
+        bwt (bytes): A transformada, com um byte por símbolo (um mmap, se o índice for aberto de um
+                     ficheiro, ou uma BWTCompacta).
+        n (int): O tamanho da transformada (sequência mais o terminador '$').
+        simbolos (bytes): Os símbolos presentes na transformada, por ordem.
+        C (array): C[c] é o número de símbolos da transformada menores que c (256 entradas).
+        intervalo_occ (int): Distância entre pontos de controlo das tabelas Occ.
+        occ (dict): Para cada símbolo c, array com o número de ocorrências de c em bwt[:j * intervalo_occ];
+                    None se a transformada for uma BWTCompacta.
+        taxa_sa (int): Taxa de amostragem do array de sufixos.
+        marcas (bytearray): Vetor de bits com as linhas i cujo SA[i] é múltiplo de taxa_sa.
+        rank_marcas (array): Número de linhas marcadas antes de cada bloco de 512 linhas.
+        sa_amostras (array): Os valores SA[i] das linhas marcadas, por ordem das linhas.
+    """
+
+    def __init__(self, bwt : Union[str, BWTCompacta], intervalo_occ : int = 64, taxa_sa : int = 32) -> None:
+        """
+        Constrói o índice a partir da transformada devolvida por bwt_transf.
+
+        Parâmetros:
+            bwt (str | BWTCompacta): A sequência de Burrows-Wheeler (com um único '$').
+            intervalo_occ (int): Distância entre pontos de controlo das tabelas Occ. Padrão é 64.
+            taxa_sa (int): Taxa de amostragem do array de sufixos (1 guarda o array completo). Padrão é 32.
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se o intervalo ou a taxa de amostragem não forem positivos.
+        """
+
+        if intervalo_occ < 1:
+            raise ValueError("O intervalo entre pontos de controlo tem de ser positivo.")
+        if taxa_sa < 1:
+            raise ValueError("A taxa de amostragem do array de sufixos tem de ser positiva.")
+        self.bwt = bwt if isinstance(bwt, BWTCompacta) else bwt.encode('latin-1')
+        self.n = len(self.bwt)
+        self.intervalo_occ = intervalo_occ
+        self.taxa_sa = taxa_sa
+        self.construir_c()
+        self.construir_occ()
+        self.construir_sa()
+
+    @classmethod
+    def da_sequencia(cls, seq : str, **kwargs) -> "FMIndex":
+        """
+        Constrói o índice diretamente a partir de uma sequência.
+
+        Parâmetros:
+            seq (str): A sequência a indexar (sem o caractere '$').
+            kwargs: Argumentos passados ao construtor.
+
+        Retorna:
+            FMIndex: O índice da sequência.
+        """
+
+        return cls(bwt_transf(seq)[0], **kwargs)
+
+    def construir_c(self) -> None:
+        """
+        Constrói a tabela C com o início de cada símbolo na primeira coluna.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        self.simbolos = bytes(sorted(set(self.bwt)))
+        self.C = array('I', bytes(4 * 256))
+        total = 0
+        for c in self.simbolos:
+            self.C[c] = total
+            total += self.bwt.count(c)
+
+    def construir_occ(self) -> None:
+        """
+        Constrói as tabelas Occ com pontos de controlo a cada intervalo_occ posições.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        if isinstance(self.bwt, BWTCompacta):
+            self.occ = None
+            return
+
+        k = self.intervalo_occ
+        self.occ = {}
+        for c in self.simbolos:
+            pontos = array('I', [0])
+            total = 0
+            for inicio in range(0, self.n, k):
+                total += self.bwt.count(c, inicio, inicio + k)
+                pontos.append(total)
+            self.occ[c] = pontos
+
+    def construir_sa(self) -> None:
+        """
+        Constrói o array de sufixos amostrado percorrendo a transformada com o mapeamento LF.
+        Apenas as linhas cujo sufixo começa numa posição múltipla de taxa_sa são guardadas.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        inicio = array('I', self.C)
+        lf = array('I', bytes(4 * self.n))
+        for i, c in enumerate(self.bwt):
+            lf[i] = inicio[c]
+            inicio[c] += 1
+
+        # A linha com '$' na última coluna é a da sequência completa (sufixo 0)
+        amostras = []
+        r = self.bwt.index(ord('$'))
+        for pos in range(self.n):
+            valor = (self.n - pos) % self.n
+            if valor % self.taxa_sa == 0:
+                amostras.append((r, valor))
+            r = lf[r]
+        del lf
+        amostras.sort()
+
+        self.marcas = bytearray((self.n + 7) // 8)
+        for r, _ in amostras:
+            self.marcas[r >> 3] |= 1 << (r & 7)
+        self.rank_marcas = array('I', [0])
+        total = 0
+        for inicio in range(0, len(self.marcas), 64):
+            total += int.from_bytes(self.marcas[inicio:inicio + 64], 'little').bit_count()
+            self.rank_marcas.append(total)
+        self.sa_amostras = array('I', (valor for _, valor in amostras))
+
+    def _marcada(self, i : int) -> bool:
+        """
+        Indica se o valor SA da linha i está guardado.
+
+        Parâmetros:
+            i (int): A linha.
+
+        Retorna:
+            bool: True se a linha estiver amostrada.
+        """
+
+        return self.marcas[i >> 3] >> (i & 7) & 1 == 1
+
+    def _rank_marcas(self, i : int) -> int:
+        """
+        Conta as linhas amostradas antes da linha i.
+
+        Parâmetros:
+            i (int): A linha (exclusiva).
+
+        Retorna:
+            int: O número de linhas amostradas em [0, i).
+        """
+
+        bloco = i >> 9
+        byte = i >> 3
+        total = self.rank_marcas[bloco] + int.from_bytes(self.marcas[bloco << 6:byte], 'little').bit_count()
+        return total + (self.marcas[byte] & ((1 << (i & 7)) - 1)).bit_count()
+
+    def sufixo(self, i : int) -> int:
+        """
+        Calcula SA[i], recuando com o mapeamento LF até uma linha amostrada.
+
+        Parâmetros:
+            i (int): A linha.
+
+        Retorna:
+            int: A posição na sequência do sufixo da linha i.
+        """
+
+        passos = 0
+        while not self._marcada(i):
+            c = self.bwt[i]
+            i = self.C[c] + self.occ_ate(c, i)
+            passos += 1
+        return (self.sa_amostras[self._rank_marcas(i)] + passos) % self.n
+
+    def memoria(self) -> dict:
+        """
+        Estima a memória ocupada pelas estruturas do índice.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            dict: Número de bytes da transformada, das tabelas Occ e do array de sufixos amostrado.
+        """
+
+        if self.occ is None:
+            bwt, occ = self.bwt.nbytes, 0
+        else:
+            bwt, occ = len(self.bwt), sum(a.itemsize * len(a) for a in self.occ.values())
+        return {
+            'bwt': bwt,
+            'occ': occ + self.C.itemsize * len(self.C),
+            'sa': len(self.marcas) + self.rank_marcas.itemsize * len(self.rank_marcas)
+                  + self.sa_amostras.itemsize * len(self.sa_amostras),
+        }
+
+    def occ_ate(self, c : int, i : int) -> int:
+        """
+        Conta as ocorrências do símbolo c em bwt[:i].
+
+        Parâmetros:
+            c (int): O símbolo (valor do byte).
+            i (int): A posição final (exclusiva).
+
+        Retorna:
+            int: O número de ocorrências.
+        """
+
+        if self.occ is None:
+            return self.bwt.rank(c, i)
+        j = i // self.intervalo_occ
+        return self.occ[c][j] + self.bwt[j * self.intervalo_occ:i].count(c)
+
+    def intervalo(self, padrao : str) -> tuple:
+        """
+        Procura para trás: calcula o intervalo de linhas cujos sufixos começam pelo padrão.
+
+        Parâmetros:
+            padrao (str): O padrão a procurar.
+
+        Retorna:
+            tuple: O intervalo (inicio, fim) de linhas, vazio se o padrão não ocorrer.
+        """
+
+        try:
+            padrao = padrao.encode('latin-1')
+        except UnicodeEncodeError:
+            return 0, 0
+        inicio, fim = 0, self.n
+        for c in reversed(padrao):
+            if c not in self.simbolos:
+                return 0, 0
+            inicio = self.C[c] + self.occ_ate(c, inicio)
+            fim = self.C[c] + self.occ_ate(c, fim)
+            if inicio >= fim:
+                return 0, 0
+        return inicio, fim
+
+    def count(self, padrao : str) -> int:
+        """
+        Conta as ocorrências do padrão na sequência.
+
+        Parâmetros:
+            padrao (str): O padrão a procurar.
+
+        Retorna:
+            int: O número de ocorrências.
+        """
+
+        inicio, fim = self.intervalo(padrao)
+        return fim - inicio
+
+    def locate(self, padrao : str) -> list:
+        """
+        Encontra as posições de todas as ocorrências do padrão na sequência.
+
+        Parâmetros:
+            padrao (str): O padrão a procurar.
+
+        Retorna:
+            list: Lista ordenada das posições onde o padrão começa.
+        """
+
+        inicio, fim = self.intervalo(padrao)
+        return sorted(self.sufixo(i) for i in range(inicio, fim))
+
+    def limites_inferiores(self, padrao : str) -> list:
+        """
+        Calcula, usando este índice como índice da sequência invertida, um limite inferior do
+        número de diferenças de cada prefixo do padrão.
+
+        O prefixo padrao[:i + 1] é dividido, da esquerda para a direita, em segmentos maximais que
+        ocorrem na sequência original (procura para trás do segmento invertido neste índice).
+        Cada segmento que não pode ser estendido obriga a pelo menos uma diferença.
+
+        Parâmetros:
+            padrao (str): O padrão a procurar.
+
+        Retorna:
+            list: D[i] é o número mínimo de diferenças de qualquer ocorrência de padrao[:i + 1].
+        """
+
+        D = []
+        diferencas = 0
+        inicio, fim = 0, self.n
+        for c in map(ord, padrao):
+            if c in self.simbolos:
+                inicio = self.C[c] + self.occ_ate(c, inicio)
+                fim = self.C[c] + self.occ_ate(c, fim)
+            else:
+                inicio, fim = 0, 0
+            if inicio >= fim:
+                diferencas += 1
+                inicio, fim = 0, self.n
+            D.append(diferencas)
+        return D
+
+    def locate_aproximado(self, padrao : str, k : int, inverso : Optional["FMIndex"] = None) -> list:
+        """
+        Encontra as ocorrências do padrão com até k substituições, por procura para trás com retrocesso.
+
+        A partir do fim do padrão, cada intervalo de linhas é estendido com todos os símbolos da
+        sequência; um símbolo diferente do padrão gasta uma diferença. Se for dado o índice da
+        sequência invertida, os ramos cujo limite inferior de diferenças no resto do padrão
+        (limites_inferiores) excede as diferenças disponíveis são cortados.
+
+        Parâmetros:
+            padrao (str): O padrão a procurar.
+            k (int): Número máximo de substituições admitidas.
+            inverso (FMIndex): Índice da sequência invertida, opcional.
+
+        Retorna:
+            list: Lista ordenada de tuplos (posição, número de diferenças).
+
+        Raises:
+            ValueError: Se k for negativo.
+        """
+
+        if k < 0:
+            raise ValueError("O número de diferenças não pode ser negativo.")
+        codigos = list(map(ord, padrao))
+        m = len(codigos)
+        # D[j + 1]: mínimo de diferenças em padrao[:j + 1], com D[0] = 0
+        D = [0] + (inverso.limites_inferiores(padrao) if inverso is not None else [0] * m)
+        if D[m] > k:
+            return []
+        simbolos = self.simbolos.replace(b'$', b'')
+
+        res = []
+        pilha = [(m - 1, 0, self.n, 0)]
+        while pilha:
+            j, inicio, fim, diferencas = pilha.pop()
+            if j < 0:
+                res.extend((self.sufixo(i), diferencas) for i in range(inicio, fim))
+                continue
+            for c in simbolos:
+                custo = diferencas + (c != codigos[j])
+                if custo + D[j] > k:
+                    continue
+                novo_inicio = self.C[c] + self.occ_ate(c, inicio)
+                novo_fim = self.C[c] + self.occ_ate(c, fim)
+                if novo_inicio < novo_fim:
+                    pilha.append((j - 1, novo_inicio, novo_fim, custo))
+        res.sort()
+        return res
+
+    def guardar(self, caminho : Union[str, os.PathLike]) -> None:
+        """
+        Escreve o índice num ficheiro binário que pode ser aberto com FMIndex.abrir.
+
+        O ficheiro tem um cabeçalho (com as posições de cada secção), seguido da transformada
+        (alinhada a mmap.ALLOCATIONGRANULARITY), da tabela C, das tabelas Occ, do vetor de
+        bits das linhas amostradas, dos seus pontos de controlo e do array de sufixos amostrado.
+        As secções numéricas são arrays de inteiros de 4 bytes na ordem de bytes da máquina.
+        Com uma BWTCompacta, a transformada é guardada compactada e a secção Occ tem a posição
+        do '$', o intervalo entre pontos de controlo e os pontos de controlo da BWTCompacta.
+
+        Parâmetros:
+            caminho (str | PathLike): O caminho do ficheiro.
+
+        Retorna:
+            None
+        """
+
+        compacta = self.occ is None
+        if compacta:
+            transformada = bytes(self.bwt.dados)
+            occ = _COMPACTA.pack(self.bwt.terminador, self.bwt.intervalo_rank) + self.bwt.pontos.tobytes()
+        else:
+            transformada = self.bwt[:]
+            occ = b''.join(self.occ[c].tobytes() for c in self.simbolos)
+        seccoes = [transformada, self.C.tobytes(), occ,
+                   bytes(self.marcas), self.rank_marcas.tobytes(), self.sa_amostras.tobytes()]
+
+        inicio_bwt = _CABECALHO.size + len(self.simbolos) + _SECCOES.size
+        inicio_bwt = -(-inicio_bwt // mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY
+        posicoes = [inicio_bwt]
+        for dados in seccoes:
+            posicoes.append(-(-(posicoes[-1] + len(dados)) // 8) * 8)
+
+        with open(caminho, 'wb') as f:
+            f.write(_CABECALHO.pack(_MAGIA, _VERSAO, sys.byteorder == 'big', compacta, self.n,
+                                    self.intervalo_occ, self.taxa_sa, len(self.simbolos)))
+            f.write(self.simbolos)
+            f.write(_SECCOES.pack(*posicoes))
+            for posicao, dados in zip(posicoes, seccoes):
+                f.write(bytes(posicao - f.tell()))
+                f.write(dados)
+            f.write(bytes(posicoes[-1] - f.tell()))
+
+    @classmethod
+    def abrir(cls, caminho : Union[str, os.PathLike]) -> "FMIndex":
+        """
+        Abre um índice escrito com guardar, mapeando o ficheiro em memória sem o copiar.
+
+        Parâmetros:
+            caminho (str | PathLike): O caminho do ficheiro.
+
+        Retorna:
+            FMIndex: O índice, pronto a responder a consultas.
+
+        Raises:
+            ValueError: Se o ficheiro não for um índice válido ou tiver sido escrito noutra ordem de bytes.
+        """
+
+        with open(caminho, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+            magia, versao, ordem, compacta, n, intervalo_occ, taxa_sa, num_simbolos = _CABECALHO.unpack_from(mm)
+            if magia != _MAGIA or versao != _VERSAO:
+                mm.close()
+                raise ValueError("O ficheiro não é um índice FM válido.")
+            if ordem != (sys.byteorder == 'big'):
+                mm.close()
+                raise ValueError("O índice foi escrito numa máquina com outra ordem de bytes.")
+            simbolos = bytes(mm[_CABECALHO.size:_CABECALHO.size + num_simbolos])
+            posicoes = _SECCOES.unpack_from(mm, _CABECALHO.size + num_simbolos)
+            tamanho_bwt = -(-n // 4) if compacta else n
+            mm_bwt = mmap.mmap(f.fileno(), tamanho_bwt, access = mmap.ACCESS_READ, offset = posicoes[0])
+
+        dados = memoryview(mm)
+        fm = cls.__new__(cls)
+        fm._mmaps = (mm, mm_bwt)
+        fm._dados = dados
+        fm.n = n
+        fm.intervalo_occ = intervalo_occ
+        fm.taxa_sa = taxa_sa
+        fm.simbolos = simbolos
+        fm.C = dados[posicoes[1]:posicoes[2]].cast('I')[:256]
+        if compacta:
+            terminador, intervalo_rank = _COMPACTA.unpack_from(mm, posicoes[2])
+            inicio = posicoes[2] + _COMPACTA.size
+            bwt = BWTCompacta.__new__(BWTCompacta)
+            bwt.n = n
+            bwt.terminador = terminador
+            bwt.intervalo_rank = intervalo_rank
+            bwt.dados = mm_bwt
+            bwt.pontos = dados[inicio:inicio + 4 * 3 * (-(-tamanho_bwt // (intervalo_rank // 4)) + 1)].cast('I')
+            fm.bwt = bwt
+            fm.occ = None
+        else:
+            fm.bwt = mm_bwt
+            pontos = -(-n // intervalo_occ) + 1
+            occ = dados[posicoes[2]:posicoes[2] + 4 * pontos * num_simbolos].cast('I')
+            fm.occ = {c: occ[j * pontos:(j + 1) * pontos] for j, c in enumerate(simbolos)}
+        fm.marcas = dados[posicoes[3]:posicoes[3] + (n + 7) // 8]
+        fm.rank_marcas = dados[posicoes[4]:posicoes[5]].cast('I')[:-(-len(fm.marcas) // 64) + 1]
+        fm.sa_amostras = dados[posicoes[5]:posicoes[6]].cast('I')[:fm.rank_marcas[-1]]
+        return fm
+
+    def fechar(self) -> None:
+        """
+        Fecha os mapeamentos em memória de um índice aberto com abrir.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        mmaps = getattr(self, '_mmaps', ())
+        if not mmaps:
+            return
+        occ = (self.bwt.pontos,) if self.occ is None else self.occ.values()
+        for vista in (self.C, self.marcas, self.rank_marcas, self.sa_amostras, *occ, self._dados):
+            vista.release()
+        for mm in mmaps:
+            mm.close()
+        self._mmaps = ()
+
+    def __enter__(self) -> "FMIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.fechar()
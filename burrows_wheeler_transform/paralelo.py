@@ -0,0 +1,105 @@
+"""
+Execução em paralelo, por blocos, de operações sobre a transformada de Burrows-Wheeler.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+
+from .bwt import bwt_transf
+
+def mapear_ordenado(funcao : Callable, iteravel : Iterable, processos : int = 1) -> Iterator:
+    """
+    Aplica uma função a cada elemento de um iterável, devolvendo os resultados pela ordem de entrada.
+
+    Com mais de um processo, os elementos são distribuídos por um ProcessPoolExecutor, mantendo
+    no máximo 2 * processos tarefas pendentes, para que a memória usada não dependa do
+    tamanho do iterável.
+
+    Parâmetros:
+        funcao (Callable): A função a aplicar (tem de poder ser serializada com pickle).
+        iteravel (Iterable): Os elementos a processar.
+        processos (int): Número de processos. Padrão é 1 (execução no próprio processo).
+
+    Retorna:
+        Iterator: Gerador dos resultados, pela ordem dos elementos.
+    """
+
+    if processos <= 1:
+        yield from map(funcao, iteravel)
+        return
+
+    with ProcessPoolExecutor(max_workers = processos) as executor:
+        pendentes = deque()
+        for elemento in iteravel:
+            pendentes.append(executor.submit(funcao, elemento))
+            if len(pendentes) >= 2 * processos:
+                yield pendentes.popleft().result()
+        while pendentes:
+            yield pendentes.popleft().result()
+
+def _bwt_bloco(tarefa : tuple) -> tuple:
+    """
+    Calcula a transformada de um bloco, medindo o tempo gasto.
+
+    Parâmetros:
+        tarefa (tuple): O índice da sequência, a posição do bloco na sequência e o bloco.
+
+    Retorna:
+        tuple: (índice da sequência, posição do bloco, transformada, posição do '$', segundos)
+    """
+
+    registo, inicio, bloco = tarefa
+    t0 = time.perf_counter()
+    bwt, pos = bwt_transf(bloco)
+    return registo, inicio, bwt, pos, time.perf_counter() - t0
+
+def _tarefas(seqs : Iterable[str], tamanho_bloco : Optional[int]) -> Iterator[tuple]:
+    """
+    Divide as sequências em blocos.
+
+    Parâmetros:
+        seqs (Iterable[str] | FastaMmap): As sequências, ou um FASTA aberto com FastaMmap (um registo por sequência).
+        tamanho_bloco (int): Tamanho máximo dos blocos, ou None para não dividir as sequências.
+
+    Retorna:
+        Iterator[tuple]: Gerador de (índice da sequência, posição do bloco, bloco).
+    """
+
+    if hasattr(seqs, 'nomes'):
+        fasta = seqs
+        seqs = (fasta.fatia(0, fasta.comprimento(r), r) for r in range(len(fasta.nomes)))
+    for registo, seq in enumerate(seqs):
+        if tamanho_bloco is None or len(seq) <= tamanho_bloco:
+            yield registo, 0, seq
+            continue
+        for inicio in range(0, len(seq), tamanho_bloco):
+            yield registo, inicio, seq[inicio:inicio + tamanho_bloco]
+
+def bwt_lote(seqs : Iterable[str], processos : Optional[int] = None,
+             tamanho_bloco : Optional[int] = None) -> Iterator[tuple]:
+    """
+    Calcula a transformada de Burrows-Wheeler de várias sequências distribuindo-as por vários processos.
+
+    Cada sequência (ou cada bloco de tamanho_bloco caracteres, se indicado) é transformada de forma
+    independente. Os resultados são devolvidos pela ordem de entrada, à medida que ficam prontos,
+    com o tempo que cada bloco demorou no processo que o calculou.
+
+    Parâmetros:
+        seqs (Iterable[str] | FastaMmap): As sequências, ou um FASTA aberto com FastaMmap (um registo por sequência).
+        processos (int): Número de processos. Padrão é o número de CPUs.
+        tamanho_bloco (int): Tamanho máximo dos blocos. Padrão é None (cada sequência é um bloco).
+
+    Retorna:
+        Iterator[tuple]: Gerador de (índice da sequência, posição do bloco, transformada, posição do '$', segundos).
+
+    Raises:
+        ValueError: Se o tamanho do bloco não for positivo.
+    """
+
+    if tamanho_bloco is not None and tamanho_bloco < 1:
+        raise ValueError("O tamanho do bloco tem de ser positivo.")
+    processos = processos or os.cpu_count() or 1
+    return mapear_ordenado(_bwt_bloco, _tarefas(seqs, tamanho_bloco), processos)
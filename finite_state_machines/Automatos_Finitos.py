@@ -5,6 +5,8 @@ Utilização do stack overflow e de LLMs (GPT 3.5 e Gemini 1.5) para algumas cor
 import sys
 import os
 
+from utils.complemento import complemento_reverso
+
 from .Auxiliares import sobreposicao
 
 class Automato:
@@ -84,14 +86,30 @@ class Automato:
             None
         """
 
+        self.tabela_transicao.update(self._tabela_para(self.padrao))
+
+    def _tabela_para(self, padrao: str) -> dict:
+
+        """
+        Calcula a tabela de transição de um padrão sobre o alfabeto do autómato.
+
+        Parâmetros:
+            padrao (str): O padrão (em maiúsculas).
+
+        Retorna:
+            dict: Dicionário que mapeia (estado, símbolo) para o próximo estado.
+        """
+
+        tabela = {}
         k = 0
-        for q in range(self.num_estados):
+        for q in range(len(padrao) + 1):
             for a in self.amino:
-                if q < len(self.padrao) and a == self.padrao[q]:
+                if q < len(padrao) and a == padrao[q]:
                     k = q + 1
                 else:
-                    k = sobreposicao(self.padrao[:q] + a, self.padrao)
-                self.tabela_transicao[(q, a)] = k
+                    k = sobreposicao(padrao[:q] + a, padrao)
+                tabela[(q, a)] = k
+        return tabela
 
     def proximo_estado(self, atual: int, simbolo: str) -> int:
 
@@ -147,6 +165,67 @@ class Automato:
                 res.append(i - len(self.padrao) + 1)
         return res
 
+    def encontrar_ocorrencias_cadeias(self, seq: str) -> list:
+
+        """
+        Encontra as ocorrências do padrão nas duas cadeias do DNA numa única passagem pela sequência.
+        São percorridos em simultâneo o autómato do padrão e o do seu complemento reverso; símbolos
+        fora do alfabeto fazem ambos voltar ao estado inicial.
+
+        Parâmetros:
+            seq (str): A sequência (cadeia '+') na qual o padrão será procurado.
+
+        Retorna:
+            list: Lista de tuplos (posição, cadeia), com cadeia '+' ou '-', ordenada pela posição.
+        """
+
+        tabela = self.tabela_transicao
+        tabela_rc = self._tabela_para(complemento_reverso(self.padrao))
+        final = self.num_estados - 1
+        q = 0
+        q_rc = 0
+        res = []
+        for i, a in enumerate(seq.upper()):
+            q = tabela.get((q, a), 0)
+            q_rc = tabela_rc.get((q_rc, a), 0)
+            if q == final:
+                res.append((i - final + 1, '+'))
+            if q_rc == final:
+                res.append((i - final + 1, '-'))
+        return res
+
+    def encontrar_ocorrencias_fasta(self, fasta, registo: int = 0) -> list:
+
+        """
+        Encontra todas as ocorrências do padrão num registo de um ficheiro FASTA mapeado em memória (utils.FastaMmap).
+        A sequência é percorrida diretamente sobre os bytes de cada linha, sem cópias; símbolos
+        fora do alfabeto (por exemplo 'N') fazem o autómato voltar ao estado inicial.
+
+        Parâmetros:
+            fasta (FastaMmap): O ficheiro FASTA indexado.
+            registo (int): Índice do registo onde procurar. Padrão é 0.
+
+        Retorna:
+            list: Uma lista de índices que representam as posições em que o padrão começa na sequência.
+        """
+
+        tabela = {}
+        for (q, a), k in self.tabela_transicao.items():
+            tabela[(q, ord(a))] = k
+            tabela[(q, ord(a.lower()))] = k
+
+        final = self.num_estados - 1
+        q = 0
+        i = 0
+        res = []
+        for segmento in fasta.segmentos(registo):
+            for b in segmento:
+                q = tabela.get((q, b), 0)
+                if q == final:
+                    res.append(i - len(self.padrao) + 1)
+                i += 1
+        return res
+
 
 
 if __name__ == "__main__":
@@ -10,6 +10,9 @@ class ArvoreDeSufixos:
     Atributos:
         nodes (dict): Um dicionário que mapeia cada nodo da árvore para seus filhos.
         num (int): O número total de nodos na árvore.
+        folhas (list): As folhas por ordem de visita em profundidade (None até serem calculadas).
+        intervalos (list): intervalos[nodo] é o par (lo, hi) tal que folhas[lo:hi] são as folhas
+                           abaixo do nodo (None até serem calculados).
     """
     def __init__(self) -> None:
         """
@@ -23,6 +26,8 @@ class ArvoreDeSufixos:
         """
         self.nodes = {0: (-1, {})}  # Node raiz
         self.num = 0
+        self.folhas = None
+        self.intervalos = None
 
     def print_arvore(self) -> None:
 
@@ -59,6 +64,8 @@ class ArvoreDeSufixos:
         self.num += 1
         self.nodes[origem][1][simbolo] = self.num
         self.nodes[self.num] = (num_folha, {})
+        self.folhas = None
+        self.intervalos = None
 
     def add_sufixo(self, p : str, num_sufixo : int) -> None:
 
@@ -86,7 +93,8 @@ class ArvoreDeSufixos:
     def build_arvore_de_sufixos(self, seq : str) -> None:
 
         """
-        Constrói a árvore de sufixos a partir de uma sequência
+        Constrói a árvore de sufixos a partir de uma sequência e calcula os intervalos de folhas,
+        para que o seu custo conte como construção e não recaia na primeira consulta.
 
         Parâmetros:
             seq (str): Sequência de aminoácidos
@@ -98,6 +106,7 @@ class ArvoreDeSufixos:
         t = seq + "$"
         for i in range(len(t)):
             self.add_sufixo(t[i:], i)
+        self.calcular_intervalos()
 
     def encontrar_padrao(self, padrao : str) -> list:
         """
@@ -120,10 +129,49 @@ class ArvoreDeSufixos:
                 return None
         return self.obter_folhas_abaixo(node)
 
+    def calcular_intervalos(self) -> None:
+
+        """
+        Percorre a árvore em profundidade, sem recursão, e guarda as folhas por ordem de visita e,
+        para cada nodo, o intervalo contíguo dessas folhas que fica abaixo dele.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        folhas = []
+        intervalos = [(0, 0)] * (self.num + 1)
+        pilha = [(0, -1)]
+        ocultos = []
+        while pilha or ocultos:
+            if not pilha:
+                pilha.append((ocultos.pop(), -1))
+            node, lo = pilha.pop()
+            if lo >= 0:
+                # Saída do nodo: todas as folhas da subárvore já foram visitadas
+                intervalos[node] = (lo, len(folhas))
+                continue
+            num_folha, filhos = self.nodes[node]
+            if num_folha >= 0:
+                intervalos[node] = (len(folhas), len(folhas) + 1)
+                folhas.append(num_folha)
+                # Os filhos de uma folha (sufixos sem '$') ficam fora dos intervalos dos antecessores
+                ocultos.extend(filhos.values())
+            else:
+                pilha.append((node, len(folhas)))
+                pilha.extend((filho, -1) for filho in reversed(list(filhos.values())))
+        self.folhas = folhas
+        self.intervalos = intervalos
+
     def obter_folhas_abaixo(self, node : int) -> list:
 
         """
-        Obtém as folhas abaixo de um nodo.
+        Obtém as folhas abaixo de um nodo, como uma fatia das folhas por ordem de visita.
+        Os intervalos são calculados na construção; se a árvore for depois alterada com add_sufixo,
+        voltam a ser calculados na consulta seguinte.
 
         Parâmetros:
             nodo (int): Nodo de início
@@ -131,14 +179,8 @@ class ArvoreDeSufixos:
         Retorna:
             list: Lista de folhas abaixo do node
         """
-        res = []
-        if self.nodes[node][0] >= 0:
-            res.append(self.nodes[node][0])
-        else:
-            for k in self.nodes[node][1]:
-                novo_node = self.nodes[node][1][k]
-                folhas = self.obter_folhas_abaixo(novo_node)
-                res.extend(folhas)
-        return res
-
 
+        if self.intervalos is None:
+            self.calcular_intervalos()
+        lo, hi = self.intervalos[node]
+        return self.folhas[lo:hi]
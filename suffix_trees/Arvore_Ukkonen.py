@@ -0,0 +1,701 @@
+"""
+Árvore de sufixos compactada construída em tempo linear pelo algoritmo de Ukkonen.
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Iterator, List, Optional, Tuple
+
+class NosDicionario:
+    """
+    Armazenamento dos nodos de uma árvore de sufixos compactada em listas paralelas,
+    com os filhos de cada nodo num dicionário indexado pelo código do símbolo.
+
+    Os códigos 0 e a partir de largura são terminadores (um por sequência, numa árvore
+    generalizada) e ordenam-se antes dos restantes símbolos.
+
+    Atributos:
+        largura (int): Número de códigos de símbolos (o 0 e os símbolos da sequência).
+        inicio (list): Início da etiqueta da aresta que entra em cada nodo (posição no texto).
+        fim (list): Fim (exclusivo) da etiqueta da aresta que entra em cada nodo.
+        folha (list): Número do sufixo de cada folha, ou -1 nos nodos internos.
+        ligacao (list): Ligação de sufixo de cada nodo interno (0, a raiz, por omissão).
+        pai (list): O pai de cada nodo (-1 na raiz).
+        filhos (list): Para cada nodo, dicionário {código do símbolo: filho}.
+    """
+
+    def __init__(self, largura : int = 0) -> None:
+        """
+        Inicializa o armazenamento sem nodos.
+
+        Parâmetros:
+            largura (int): Número de códigos de símbolos. Padrão é 0 (todos os códigos são terminadores).
+
+        Retorna:
+            None
+        """
+
+        self.largura = largura
+        self.inicio = []
+        self.fim = []
+        self.folha = []
+        self.ligacao = []
+        self.pai = []
+        self.filhos = []
+
+    def novo(self, inicio : int, fim : int, folha : int = -1) -> int:
+        """
+        Cria um nodo.
+
+        Parâmetros:
+            inicio (int): Início da etiqueta da aresta.
+            fim (int): Fim (exclusivo) da etiqueta da aresta.
+            folha (int): Número do sufixo, se for uma folha. Padrão é -1.
+
+        Retorna:
+            int: O identificador do nodo.
+        """
+
+        self.inicio.append(inicio)
+        self.fim.append(fim)
+        self.folha.append(folha)
+        self.ligacao.append(0)
+        self.pai.append(-1)
+        self.filhos.append({})
+        return len(self.inicio) - 1
+
+    def filho(self, no : int, codigo : int) -> int:
+        """
+        Devolve o filho de um nodo pela aresta que começa pelo símbolo dado.
+
+        Parâmetros:
+            no (int): O nodo.
+            codigo (int): O código do símbolo.
+
+        Retorna:
+            int: O filho, ou -1 se não existir.
+        """
+
+        return self.filhos[no].get(codigo, -1)
+
+    def ligar(self, no : int, codigo : int, filho : int) -> None:
+        """
+        Define o filho de um nodo pela aresta que começa pelo símbolo dado.
+
+        Parâmetros:
+            no (int): O nodo.
+            codigo (int): O código do primeiro símbolo da aresta.
+            filho (int): O filho.
+
+        Retorna:
+            None
+        """
+
+        self.filhos[no][codigo] = filho
+        self.pai[filho] = no
+
+    def iterar_filhos(self, no : int) -> Iterator[Tuple[int, int]]:
+        """
+        Percorre os filhos de um nodo por ordem dos códigos dos símbolos.
+
+        Parâmetros:
+            no (int): O nodo.
+
+        Retorna:
+            Iterator[tuple]: Gerador de (código, filho).
+        """
+
+        return iter(sorted(self.filhos[no].items(), key = lambda item: (0 < item[0] < self.largura, item[0])))
+
+    def __len__(self) -> int:
+        return len(self.inicio)
+
+class NosCompactos:
+    """
+    Armazenamento compacto dos nodos de uma árvore de sufixos compactada: arrays paralelos de
+    inteiros de 4 bytes e uma tabela de filhos com largura posições por nodo.
+
+    Cada nodo ocupa 4 * (5 + largura) bytes (40 bytes para DNA, com largura 5: '$' e ACGT),
+    contra várias centenas com listas e dicionários, pelo que alfabetos pequenos tiram
+    mais partido desta representação. Os terminadores das sequências de uma árvore
+    generalizada a partir da segunda têm códigos a partir de largura e os respetivos filhos
+    ficam num dicionário à parte; tal como o código 0, ordenam-se antes dos restantes símbolos.
+
+    Atributos:
+        largura (int): Número de códigos de símbolos (posições de cada nodo na tabela de filhos).
+        inicio (array): Início da etiqueta da aresta que entra em cada nodo (posição no texto).
+        fim (array): Fim (exclusivo) da etiqueta da aresta que entra em cada nodo.
+        folha (array): Número do sufixo de cada folha, ou -1 nos nodos internos.
+        ligacao (array): Ligação de sufixo de cada nodo interno (0, a raiz, por omissão).
+        pai (array): O pai de cada nodo (-1 na raiz).
+        filhos (array): filhos[no * largura + codigo] é o filho de no pelo símbolo codigo, ou -1.
+        extra (dict): Para cada nodo com filhos por códigos a partir de largura, dicionário {código: filho}.
+    """
+
+    def __init__(self, largura : int) -> None:
+        """
+        Inicializa o armazenamento sem nodos.
+
+        Parâmetros:
+            largura (int): Número de códigos de símbolos.
+
+        Retorna:
+            None
+        """
+
+        self.largura = largura
+        self.inicio = array('i')
+        self.fim = array('i')
+        self.folha = array('i')
+        self.ligacao = array('i')
+        self.pai = array('i')
+        self.filhos = array('i')
+        self.extra = {}
+        self._vazio = array('i', [-1]) * largura
+
+    def novo(self, inicio : int, fim : int, folha : int = -1) -> int:
+        """
+        Cria um nodo.
+
+        Parâmetros:
+            inicio (int): Início da etiqueta da aresta.
+            fim (int): Fim (exclusivo) da etiqueta da aresta.
+            folha (int): Número do sufixo, se for uma folha. Padrão é -1.
+
+        Retorna:
+            int: O identificador do nodo.
+        """
+
+        self.inicio.append(inicio)
+        self.fim.append(fim)
+        self.folha.append(folha)
+        self.ligacao.append(0)
+        self.pai.append(-1)
+        self.filhos.extend(self._vazio)
+        return len(self.inicio) - 1
+
+    def filho(self, no : int, codigo : int) -> int:
+        """
+        Devolve o filho de um nodo pela aresta que começa pelo símbolo dado.
+
+        Parâmetros:
+            no (int): O nodo.
+            codigo (int): O código do símbolo.
+
+        Retorna:
+            int: O filho, ou -1 se não existir.
+        """
+
+        if codigo < self.largura:
+            return self.filhos[no * self.largura + codigo]
+        return self.extra.get(no, {}).get(codigo, -1)
+
+    def ligar(self, no : int, codigo : int, filho : int) -> None:
+        """
+        Define o filho de um nodo pela aresta que começa pelo símbolo dado.
+
+        Parâmetros:
+            no (int): O nodo.
+            codigo (int): O código do primeiro símbolo da aresta.
+            filho (int): O filho.
+
+        Retorna:
+            None
+        """
+
+        if codigo < self.largura:
+            self.filhos[no * self.largura + codigo] = filho
+        else:
+            self.extra.setdefault(no, {})[codigo] = filho
+        self.pai[filho] = no
+
+    def iterar_filhos(self, no : int) -> Iterator[Tuple[int, int]]:
+        """
+        Percorre os filhos de um nodo por ordem dos códigos dos símbolos.
+
+        Parâmetros:
+            no (int): O nodo.
+
+        Retorna:
+            Iterator[tuple]: Gerador de (código, filho).
+        """
+
+        base = no * self.largura
+        filhos = self.filhos[base:base + self.largura]
+        if filhos and filhos[0] >= 0:
+            yield 0, filhos[0]
+        if no in self.extra:
+            yield from sorted(self.extra[no].items())
+        for codigo in range(1, self.largura):
+            if filhos[codigo] >= 0:
+                yield codigo, filhos[codigo]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Número de bytes ocupados pelos arrays.
+        """
+
+        return sum(a.itemsize * len(a) for a in (self.inicio, self.fim, self.folha, self.ligacao, self.pai, self.filhos))
+
+    def __len__(self) -> int:
+        return len(self.inicio)
+
+class ArvoreDeSufixosCompacta:
+    """
+    Árvore de sufixos compactada, construída pelo algoritmo de Ukkonen em tempo O(n).
+
+    Ao contrário da ArvoreDeSufixos, que insere cada sufixo símbolo a símbolo (O(n²) nodos),
+    cada aresta tem como etiqueta um par (inicio, fim) de posições no texto e a árvore tem no
+    máximo 2n nodos. Os símbolos são convertidos em códigos inteiros, com o terminador '$' no 0.
+    Os nodos são guardados pelo armazenamento indicado: NosDicionario (qualquer alfabeto) ou
+    NosCompactos (arrays de inteiros, para sequências longas com alfabetos pequenos, como o DNA).
+
+    Atributos:
+        texto (array): Os códigos dos símbolos da sequência seguida de '$'.
+        inicios (array): Posição de início de cada sequência no texto ([0] numa árvore de uma sequência).
+        codigos (dict): Código de cada símbolo.
+        armazenamento (type): A classe de armazenamento dos nodos.
+        nos (NosDicionario | NosCompactos): Os nodos da árvore (o nodo 0 é a raiz).
+        folhas (array): Os números dos sufixos por ordem lexicográfica (o array de sufixos), ou None
+                        até serem calculados.
+        intervalos (array): folhas[intervalos[2 * no]:intervalos[2 * no + 1]] são as folhas abaixo
+                            de no (None até serem calculados).
+    """
+
+    def __init__(self, armazenamento : type = NosDicionario) -> None:
+        """
+        Inicializa uma árvore vazia.
+
+        Parâmetros:
+            armazenamento (type): A classe de armazenamento dos nodos. Padrão é NosDicionario.
+
+        Retorna:
+            None
+        """
+
+        self.texto = array('i')
+        self.inicios = array('i')
+        self.codigos = {'$': 0}
+        self.armazenamento = armazenamento
+        self.nos = armazenamento(1)
+        self.nos.novo(0, 0)
+        self.folhas = None
+        self.intervalos = None
+
+    def print_arvore(self) -> None:
+        """
+        Imprime a árvore de sufixos, com a etiqueta de cada aresta.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        simbolos = {v: k for k, v in self.codigos.items()}
+        for no in range(len(self.nos)):
+            etiqueta = ''.join(simbolos.get(c, '$') for c in self.texto[self.nos.inicio[no]:self.nos.fim[no]])
+            if self.nos.folha[no] >= 0:
+                print(f"{no} ({etiqueta}) : {self.nos.folha[no]}")
+            else:
+                print(f"{no} ({etiqueta}) -> {[f for _, f in self.nos.iterar_filhos(no)]}")
+
+    def build_arvore_de_sufixos(self, seq : str) -> None:
+        """
+        Constrói a árvore de sufixos de uma sequência pelo algoritmo de Ukkonen.
+
+        Parâmetros:
+            seq (str): A sequência (sem o caractere '$').
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se a sequência contiver o caractere '$'.
+        """
+
+        if '$' in seq:
+            raise ValueError("A sequência não pode conter o caractere '$'.")
+        self.codigos = {'$': 0}
+        for simbolo in sorted(set(seq)):
+            self.codigos[simbolo] = len(self.codigos)
+        self.texto = array('i', [self.codigos[s] for s in seq])
+        self.texto.append(0)
+        self.inicios = array('i', [0])
+        self.construir_ukkonen()
+
+    def construir_ukkonen(self) -> None:
+        """
+        Constrói a árvore de sufixos do texto já codificado (terminado por um código único) pelo
+        algoritmo de Ukkonen.
+
+        O texto é percorrido uma vez; o ponto ativo (nodo, aresta, comprimento) indica onde
+        começa a inserção dos sufixos pendentes (resto) e as ligações de sufixo evitam voltar
+        à raiz depois de cada inserção. As folhas são criadas já com o fim no final do texto.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        self.nos = self.armazenamento(len(self.codigos))
+        self.nos.novo(0, 0)
+        self.folhas = None
+        self.intervalos = None
+
+        t = self.texto
+        n = len(t)
+        nos = self.nos
+        inicio, fim, ligacao = nos.inicio, nos.fim, nos.ligacao
+
+        ativo_no, ativo_aresta, ativo_comp = 0, 0, 0
+        resto = 0
+        for i, c in enumerate(t):
+            resto += 1
+            ultimo_interno = -1
+            while resto > 0:
+                if ativo_comp == 0:
+                    ativo_aresta = i
+                prox = nos.filho(ativo_no, t[ativo_aresta])
+                if prox < 0:
+                    nos.ligar(ativo_no, t[ativo_aresta], nos.novo(i, n, i - resto + 1))
+                    if ultimo_interno >= 0:
+                        ligacao[ultimo_interno] = ativo_no
+                        ultimo_interno = -1
+                else:
+                    comp = fim[prox] - inicio[prox]
+                    if ativo_comp >= comp:
+                        # Desce pela aresta (skip/count)
+                        ativo_no = prox
+                        ativo_aresta += comp
+                        ativo_comp -= comp
+                        continue
+                    if t[inicio[prox] + ativo_comp] == c:
+                        # O sufixo já está na árvore: termina a fase
+                        if ultimo_interno >= 0 and ativo_no != 0:
+                            ligacao[ultimo_interno] = ativo_no
+                        ativo_comp += 1
+                        break
+                    # Divide a aresta e pendura a nova folha no nodo intermédio
+                    meio = nos.novo(inicio[prox], inicio[prox] + ativo_comp)
+                    nos.ligar(ativo_no, t[ativo_aresta], meio)
+                    nos.ligar(meio, c, nos.novo(i, n, i - resto + 1))
+                    inicio[prox] += ativo_comp
+                    nos.ligar(meio, t[inicio[prox]], prox)
+                    if ultimo_interno >= 0:
+                        ligacao[ultimo_interno] = meio
+                    ultimo_interno = meio
+                resto -= 1
+                if ativo_no == 0 and ativo_comp > 0:
+                    ativo_comp -= 1
+                    ativo_aresta = i - resto + 1
+                elif ativo_no != 0:
+                    ativo_no = ligacao[ativo_no]
+
+    def encontrar_padrao(self, padrao : str) -> Optional[list]:
+        """
+        Encontra o padrão na árvore de sufixos.
+
+        Parâmetros:
+            padrao (str): Padrão a ser procurado
+
+        Retorna:
+            list: Lista de índices onde o padrão aparece na sequência (pela ordem lexicográfica
+                  dos sufixos), ou None se não aparecer.
+        """
+
+        t = self.texto
+        no = 0
+        pos = 0
+        while pos < len(padrao):
+            codigo = self.codigos.get(padrao[pos])
+            if codigo is None:
+                return None
+            no = self.nos.filho(no, codigo)
+            if no < 0:
+                return None
+            for j in range(self.nos.inicio[no], self.nos.fim[no]):
+                if pos == len(padrao):
+                    break
+                if self.codigos.get(padrao[pos]) != t[j]:
+                    return None
+                pos += 1
+        return self.obter_folhas_abaixo(no)
+
+    def calcular_intervalos(self) -> None:
+        """
+        Percorre a árvore em profundidade, sem recursão e por ordem dos códigos dos símbolos,
+        guardando as folhas por ordem de visita e o intervalo dessas folhas abaixo de cada nodo.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        folha = self.nos.folha
+        folhas = array('i')
+        intervalos = array('i', bytes(8 * len(self.nos)))
+        pilha = [(0, -1)]
+        while pilha:
+            no, lo = pilha.pop()
+            if lo >= 0:
+                intervalos[2 * no] = lo
+                intervalos[2 * no + 1] = len(folhas)
+            elif folha[no] >= 0:
+                intervalos[2 * no] = len(folhas)
+                intervalos[2 * no + 1] = len(folhas) + 1
+                folhas.append(folha[no])
+            else:
+                pilha.append((no, len(folhas)))
+                pilha.extend((f, -1) for _, f in reversed(list(self.nos.iterar_filhos(no))))
+        self.folhas = folhas
+        self.intervalos = intervalos
+
+    def obter_folhas_abaixo(self, no : int) -> list:
+        """
+        Obtém as folhas abaixo de um nodo, por ordem lexicográfica dos sufixos, como uma fatia das
+        folhas calculadas por calcular_intervalos (na primeira consulta).
+
+        Parâmetros:
+            no (int): Nodo de início
+
+        Retorna:
+            list: Lista de folhas abaixo do nodo
+        """
+
+        if self.intervalos is None:
+            self.calcular_intervalos()
+        return self.folhas[self.intervalos[2 * no]:self.intervalos[2 * no + 1]].tolist()
+
+    def ordem_prefixa(self) -> array:
+        """
+        Percorre a árvore em pré-ordem, sem recursão e por ordem dos códigos dos símbolos.
+        Percorrer a ordem ao contrário visita cada nodo depois de todos os seus descendentes.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            array: Os nodos em pré-ordem.
+        """
+
+        ordem = array('i')
+        pilha = [0]
+        while pilha:
+            no = pilha.pop()
+            ordem.append(no)
+            pilha.extend(f for _, f in reversed(list(self.nos.iterar_filhos(no))))
+        return ordem
+
+    def profundidades(self, ordem : Optional[array] = None) -> array:
+        """
+        Calcula o comprimento do rótulo do caminho da raiz até cada nodo.
+
+        Parâmetros:
+            ordem (array): Os nodos em pré-ordem, se já tiverem sido calculados.
+
+        Retorna:
+            array: A profundidade (em símbolos) de cada nodo.
+        """
+
+        if ordem is None:
+            ordem = self.ordem_prefixa()
+        inicio, fim, pai = self.nos.inicio, self.nos.fim, self.nos.pai
+        profundidade = array('i', bytes(4 * len(self.nos)))
+        for no in ordem[1:]:
+            profundidade[no] = profundidade[pai[no]] + fim[no] - inicio[no]
+        return profundidade
+
+    def _rotulo(self, no : int, comprimento : int) -> str:
+        """
+        Devolve os primeiros símbolos do rótulo do caminho até um nodo, lidos a partir de uma das suas folhas.
+
+        Parâmetros:
+            no (int): O nodo.
+            comprimento (int): O número de símbolos.
+
+        Retorna:
+            str: O rótulo ('' se o comprimento for 0, mesmo numa árvore sem folhas).
+        """
+
+        if not comprimento:
+            return ''
+        if self.intervalos is None:
+            self.calcular_intervalos()
+        simbolos = {v: k for k, v in self.codigos.items()}
+        p = self.folhas[self.intervalos[2 * no]]
+        return ''.join(simbolos[c] for c in self.texto[p:p + comprimento])
+
+    def maior_repeticao(self) -> str:
+        """
+        Encontra a maior substring que ocorre pelo menos duas vezes: o rótulo do nodo interno mais profundo.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            str: A maior repetição ('' se nenhum símbolo se repetir).
+        """
+
+        profundidade = self.profundidades()
+        folha = self.nos.folha
+        melhor = max((no for no in range(1, len(self.nos)) if folha[no] < 0), key = profundidade.__getitem__, default = 0)
+        return self._rotulo(melhor, profundidade[melhor])
+
+    def repeticoes_maximas(self, comprimento_minimo : int = 1) -> List[Tuple[str, int]]:
+        """
+        Enumera as repetições máximas: substrings que ocorrem pelo menos duas vezes e que não podem
+        ser estendidas para a direita nem para a esquerda sem perder ocorrências.
+
+        Cada repetição máxima é o rótulo de um nodo interno (máxima à direita) cujas folhas não
+        têm todas o mesmo símbolo à esquerda (máxima à esquerda); um sufixo no início de uma
+        sequência conta como tendo um símbolo à esquerda único. O símbolo à esquerda comum de
+        cada nodo é calculado dos filhos para os pais, percorrendo a pré-ordem ao contrário.
+
+        Parâmetros:
+            comprimento_minimo (int): Comprimento mínimo das repetições. Padrão é 1.
+
+        Retorna:
+            list: Lista de tuplos (repetição, número de ocorrências), por ordem lexicográfica.
+        """
+
+        ordem = self.ordem_prefixa()
+        profundidade = self.profundidades(ordem)
+        if self.intervalos is None:
+            self.calcular_intervalos()
+        folha, pai = self.nos.folha, self.nos.pai
+        inicios = set(self.inicios)
+
+        # -1: ainda sem folhas; -2: símbolos à esquerda diferentes; senão o código do símbolo comum
+        esquerda = array('i', [-1]) * len(self.nos)
+        for no in reversed(ordem):
+            if folha[no] >= 0:
+                esquerda[no] = -2 if folha[no] in inicios else self.texto[folha[no] - 1]
+            if no:
+                atual = esquerda[pai[no]]
+                if atual == -1:
+                    esquerda[pai[no]] = esquerda[no]
+                elif atual != esquerda[no]:
+                    esquerda[pai[no]] = -2
+
+        res = []
+        for no in ordem[1:]:
+            if folha[no] < 0 and esquerda[no] == -2 and profundidade[no] >= comprimento_minimo:
+                ocorrencias = self.intervalos[2 * no + 1] - self.intervalos[2 * no]
+                res.append((self._rotulo(no, profundidade[no]), ocorrencias))
+        return res
+
+
+class ArvoreDeSufixosGeneralizada(ArvoreDeSufixosCompacta):
+    """
+    Árvore de sufixos generalizada de uma coleção de sequências, construída pelo algoritmo de Ukkonen.
+
+    As sequências são concatenadas, cada uma seguida de um terminador próprio (o código 0 para a
+    primeira e largura + k - 1 para a sequência k > 0), e a árvore é construída sobre a
+    concatenação. Os terminadores ordenam-se pela ordem das sequências e antes de qualquer outro
+    símbolo. As arestas das folhas terminam no terminador da própria sequência e cada folha é
+    identificada por (índice da sequência, posição na sequência).
+    """
+
+    def build_arvore_de_sufixos(self, seqs : List[str]) -> None:
+        """
+        Constrói a árvore de sufixos generalizada de várias sequências.
+
+        Parâmetros:
+            seqs (list): As sequências (sem o caractere '$').
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se alguma sequência contiver o caractere '$'.
+        """
+
+        if any('$' in seq for seq in seqs):
+            raise ValueError("As sequências não podem conter o caractere '$'.")
+        self.codigos = {'$': 0}
+        for simbolo in sorted(set().union(*seqs)):
+            self.codigos[simbolo] = len(self.codigos)
+        largura = len(self.codigos)
+
+        self.texto = array('i')
+        self.inicios = array('i')
+        for k, seq in enumerate(seqs):
+            self.inicios.append(len(self.texto))
+            self.texto.extend(self.codigos[s] for s in seq)
+            self.texto.append(largura + k - 1 if k else 0)
+        self.construir_ukkonen()
+
+        # Corta as arestas das folhas no terminador da sequência de cada sufixo
+        fins = self.inicios[1:]
+        fins.append(len(self.texto))
+        for no in range(len(self.nos)):
+            if self.nos.folha[no] >= 0:
+                self.nos.fim[no] = fins[bisect_right(self.inicios, self.nos.folha[no]) - 1]
+
+    def posicao(self, sufixo : int) -> Tuple[int, int]:
+        """
+        Converte a posição de um sufixo na concatenação em (índice da sequência, posição na sequência).
+
+        Parâmetros:
+            sufixo (int): A posição na concatenação.
+
+        Retorna:
+            tuple: (índice da sequência, posição na sequência)
+        """
+
+        k = bisect_right(self.inicios, sufixo) - 1
+        return k, sufixo - self.inicios[k]
+
+    def obter_folhas_abaixo(self, no : int) -> list:
+        """
+        Obtém as folhas abaixo de um nodo, por ordem lexicográfica dos sufixos.
+
+        Parâmetros:
+            no (int): Nodo de início
+
+        Retorna:
+            list: Lista de tuplos (índice da sequência, posição na sequência)
+        """
+
+        return [self.posicao(i) for i in super().obter_folhas_abaixo(no)]
+
+    def maior_substring_comum(self) -> str:
+        """
+        Encontra a maior substring comum a todas as sequências (com duas sequências, a maior
+        substring comum entre elas): o nodo interno mais profundo com folhas de todas as sequências.
+        As sequências presentes abaixo de cada nodo são guardadas num inteiro usado como conjunto
+        de bits e propagadas dos filhos para os pais, percorrendo a pré-ordem ao contrário.
+        Com uma única sequência, o resultado é a própria sequência.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            str: A maior substring comum ('' se não houver nenhuma).
+        """
+
+        ordem = self.ordem_prefixa()
+        profundidade = self.profundidades(ordem)
+        folha, pai = self.nos.folha, self.nos.pai
+        todas = (1 << len(self.inicios)) - 1
+
+        sequencias = [0] * len(self.nos)
+        for no in reversed(ordem):
+            if folha[no] >= 0:
+                sequencias[no] = 1 << self.posicao(folha[no])[0]
+            if no:
+                sequencias[pai[no]] |= sequencias[no]
+
+        # Só há folhas de todas as sequências com uma única sequência; o terminador não conta
+        for no in range(len(self.nos)):
+            if folha[no] >= 0:
+                profundidade[no] -= 1
+        melhor = max((no for no in ordem if sequencias[no] == todas), key = profundidade.__getitem__, default = 0)
+        return self._rotulo(melhor, profundidade[melhor])
@@ -7,8 +7,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
 
-from automatos_finitos.Automatos_Finitos import *
-from automatos_finitos.Automatos_Finitos import *
+from finite_state_machines.Automatos_Finitos import *
+from finite_state_machines.Automatos_Finitos import *
+from utils.fasta_mmap import FastaMmap
 
 class TestAutomaton(unittest.TestCase):
     """
@@ -57,6 +58,22 @@ class TestAutomaton(unittest.TestCase):
         ocorrencias_vazio = automato.encontrar_ocorrencias("")
         self.assertEqual(ocorrencias_vazio, [])
 
+    def test_encontrar_ocorrencias_cadeias(self):
+        """
+        Verifica se as ocorrências são encontradas nas duas cadeias numa só passagem.
+        """
+        automato = Automato("ATG", "ATGCGCATGATG")
+        ocorrencias = automato.encontrar_ocorrencias_cadeias("ATGCGCATGATGCATCAT")
+        self.assertEqual(ocorrencias, [(0, '+'), (5, '-'), (6, '+'), (9, '+'), (12, '-'), (15, '-')])
+
+    def test_encontrar_ocorrencias_fasta(self):
+        """
+        Verifica se as ocorrências são encontradas sobre um FASTA, incluindo as que atravessam linhas.
+        """
+        automato = Automato("ATG", "")
+        fasta = FastaMmap(b">s1\nATGCG\nCAT\nGANTG\natg\n")
+        self.assertEqual(automato.encontrar_ocorrencias_fasta(fasta), [0, 6, 13])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,9 +3,16 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import io
+import pickle
+import random
 import unittest
 
-from boyer_moore.BoyerMoore import BoyerMoore
+from boyer_moore.BoyerMoore import BoyerMoore, BoyerMooreCompact
+from utils import complemento_reverso
+from boyer_moore.BoyerMooreSet import BoyerMooreSet
+from boyer_moore.BoyerMooreCache import BoyerMooreCache
+from utils.fasta_mmap import FastaMmap
 
 class TestBoyerMoore(unittest.TestCase):
     
@@ -27,6 +34,160 @@ class TestBoyerMoore(unittest.TestCase):
         result = bm.search_pattern("ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC")
         self.assertEqual(result, list(range(len("ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC") + 1)))
 
+    def test_search_pattern_set(self):
+        # Teste com vários padrões numa só passagem
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        padroes = ["ACCA", "ATG", "CCAT", "GTC"]
+        bms = BoyerMooreSet("ACTG", padroes)
+        esperado = sorted((pos, pid) for pid, p in enumerate(padroes)
+                          for pos in BoyerMoore("ACTG", p).search_pattern(seq))
+        result = bms.search_pattern(seq)
+        self.assertEqual(result, [(pid, pos) for pos, pid in esperado])
+
+    def test_search_pattern_set_grande(self):
+        # Muitos padrões: o tamanho dos blocos cresce com o conjunto e o resultado não muda
+        gerador = random.Random(7)
+        seq = "".join(gerador.choice("ACGT") for _ in range(20000))
+        padroes = ["".join(gerador.choice("ACGT") for _ in range(12)) for _ in range(300)]
+        padroes += [seq[i:i + 15] for i in range(0, 20000, 400)]
+        bms = BoyerMooreSet("ACGT", padroes)
+        self.assertEqual(bms.block, BoyerMooreSet.tamanho_bloco(4, 12, len(padroes)))
+        self.assertGreater(bms.block, 2)
+        esperado = sorted((pos, pid) for pid, p in enumerate(padroes)
+                          for pos in range(len(seq)) if seq.startswith(p, pos))
+        self.assertEqual(bms.search_pattern(seq), [(pid, pos) for pos, pid in esperado])
+        self.assertEqual(BoyerMooreSet("ACGT", padroes, block=2).search_pattern(seq), bms.search_pattern(seq))
+
+    def test_search_pattern_set_invalido(self):
+        # Teste com conjunto vazio e padrão vazio
+        with self.assertRaises(ValueError):
+            BoyerMooreSet("ACTG", [])
+        with self.assertRaises(ValueError):
+            BoyerMooreSet("ACTG", ["ACG", ""])
+
+    def test_search_pattern_stream(self):
+        # Teste com o texto dividido em blocos (ocorrências nas fronteiras)
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        bm = BoyerMoore("ACTG", "ACCA")
+        esperado = bm.search_pattern(seq)
+        for tamanho in (1, 3, 4, 7, len(seq)):
+            blocos = [seq[i:i + tamanho] for i in range(0, len(seq), tamanho)]
+            self.assertEqual(list(bm.search_pattern_stream(blocos)), esperado)
+        # Teste com ficheiro em modo texto e binário
+        self.assertEqual(list(bm.search_pattern_stream(io.StringIO(seq), chunk_size=5)), esperado)
+        self.assertEqual(list(bm.search_pattern_stream(io.BytesIO(seq.encode()), chunk_size=5)), esperado)
+
+    def test_search_fasta(self):
+        # Teste com ocorrências que atravessam quebras de linha do FASTA
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        linhas = "\n".join(seq[i:i + 5] for i in range(0, len(seq), 5))
+        fasta = FastaMmap((">cromossoma\n" + linhas + "\n").encode())
+        bm = BoyerMoore("ACTG", "ACCA")
+        self.assertEqual(list(bm.search_fasta(fasta, chunk_size=6)), bm.search_pattern(seq))
+        # 'N' e minúsculas: o mesmo resultado que o autómato
+        fasta = FastaMmap(b">c\nNNNNACGTacgtACGT\n")
+        self.assertEqual(list(BoyerMoore("ACGT", "ACGT").search_fasta(fasta)), [4, 8, 12])
+        self.assertEqual(list(BoyerMooreCompact("ACGT", "ACGT").search_fasta(fasta, chunk_size=3)), [4, 8, 12])
+        self.assertEqual(BoyerMoore("ACGT", "ACGT").search_pattern("ACNTACGT"), [4])
+
+    def test_search_pattern_compact(self):
+        # Teste da variante compacta sobre bytes e str
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        for padrao in ("ACCA", "GTC", "A", "ATAGAACCAATG"):
+            esperado = BoyerMoore("ACTG", padrao).search_pattern(seq)
+            bmc = BoyerMooreCompact("ACTG", padrao)
+            self.assertEqual(bmc.search_pattern(seq.encode()), esperado)
+            self.assertEqual(bmc.search_pattern(seq), esperado)
+        self.assertEqual(BoyerMooreCompact("ACTG", "ACCA").search_pattern(b""), [])
+
+    def test_search_pattern_parallel(self):
+        # Teste com fragmentos pequenos para forçar ocorrências nas fronteiras
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC" * 5
+        bm = BoyerMoore("ACTG", "ACCA")
+        esperado = bm.search_pattern(seq)
+        for tamanho in (1, 3, 8):
+            self.assertEqual(bm.search_pattern_parallel(seq, workers=2, shard_size=tamanho), esperado)
+        self.assertEqual(bm.search_pattern_parallel(seq, workers=1), esperado)
+
+    def test_search_pattern_approx(self):
+        # Teste com até k substituições, comparando com a verificação exaustiva
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        padrao = "ACCATG"
+        bm = BoyerMoore("ACTG", padrao)
+        compacto = BoyerMooreCompact("ACTG", padrao)
+        for k in range(0, len(padrao) + 1):
+            esperado = []
+            for i in range(len(seq) - len(padrao) + 1):
+                dif = sum(a != b for a, b in zip(padrao, seq[i:]))
+                if dif <= k:
+                    esperado.append((i, dif))
+            self.assertEqual(bm.search_pattern_approx(seq, k), esperado)
+            # A variante compacta responde igual sobre str e sobre bytes
+            self.assertEqual(compacto.search_pattern_approx(seq, k), esperado)
+            self.assertEqual(compacto.search_pattern_approx(seq.encode(), k), esperado)
+        with self.assertRaises(ValueError):
+            bm.search_pattern_approx(seq, -1)
+
+    def test_export_tables(self):
+        # Teste da reconstrução a partir das tabelas serializadas
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        for classe in (BoyerMoore, BoyerMooreCompact):
+            bm = classe("ACTG", "ACCA")
+            tabelas = pickle.loads(pickle.dumps(bm.export_tables()))
+            copia = classe.from_tables(tabelas)
+            self.assertEqual(copia.search_pattern(seq), bm.search_pattern(seq))
+
+    def test_cache(self):
+        # Teste dos contadores e da política LRU
+        cache = BoyerMooreCache(maxsize=2)
+        bm = cache.get("ACTG", "ACCA")
+        self.assertIs(cache.get("ACTG", "ACCA"), bm)
+        cache.get("ACTG", "GTC")
+        cache.get("ACTG", "ATG")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 3, 2))
+        self.assertNotIn(("ACTG", "ACCA"), cache)
+
+        # Teste do carregamento das tabelas noutra cache
+        outra = BoyerMooreCache(maxsize=2)
+        outra.load_tables(pickle.loads(pickle.dumps(cache.export_tables())))
+        outra.get("ACTG", "ATG")
+        self.assertEqual((outra.hits, outra.misses), (1, 0))
+        with self.assertRaises(ValueError):
+            BoyerMooreCache(maxsize=0)
+
+    def test_search_both_strands(self):
+        # Teste com ocorrências nas duas cadeias
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        bm = BoyerMoore("ACTG", "CATG")
+        esperado = sorted([(i, "+") for i in bm.search_pattern(seq)] +
+                          [(i, "-") for i in BoyerMoore("ACTG", complemento_reverso("CATG")).search_pattern(seq)])
+        self.assertEqual(bm.search_both_strands(seq), esperado)
+        # Padrão palindrómico: reportado nas duas cadeias
+        self.assertEqual(BoyerMoore("ACTG", "ATAT").search_both_strands("GATATC"), [(1, "+"), (1, "-")])
+        # Texto em bytes na variante compacta
+        self.assertEqual(BoyerMooreCompact("ACGT", "ACGT").search_both_strands(b"TTACGTAAACGA"), [(2, "+"), (2, "-")])
+        self.assertEqual(BoyerMooreCompact("ACGT", "GTTT").search_both_strands(bytearray(b"TTACGTAAACGA")), [(6, "-")])
+
+    def test_search_batch(self):
+        # Teste com várias leituras, incluindo ocorrências que atravessariam fronteiras
+        leituras = ["ACCAT", "GACC", "ATTT", "", "ACCACCA", "AC"]
+        bm = BoyerMoore("ACTG", "ACCA")
+        esperado = [(r, i) for r, seq in enumerate(leituras) for i in bm.search_pattern(seq)]
+        ids, posicoes = bm.search_batch(leituras)
+        self.assertEqual(list(zip(ids, posicoes)), esperado)
+
+        # Teste com o buffer já concatenado
+        offsets = [0, 5, 9, 13, 13, 20]
+        ids, posicoes = bm.search_batch("".join(leituras), offsets)
+        self.assertEqual(list(zip(ids, posicoes)), esperado)
+
+        # Leituras em bytes na variante compacta
+        compacto = BoyerMooreCompact("ACTG", "ACCA")
+        ids, posicoes = compacto.search_batch([leitura.encode() for leitura in leituras])
+        self.assertEqual(list(zip(ids, posicoes)), esperado)
+        ids, posicoes = compacto.search_batch(bytearray(b"".join(leitura.encode() for leitura in leituras)), offsets)
+        self.assertEqual(list(zip(ids, posicoes)), esperado)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -3,9 +3,15 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import io
 import unittest
 
-from bwt.bwt import *
+from burrows_wheeler_transform.bwt import *
+from burrows_wheeler_transform.bwt_compacta import BWTCompacta
+from burrows_wheeler_transform.bwt_multipla import BWTMultipla
+from burrows_wheeler_transform.compressao import *
+from burrows_wheeler_transform.paralelo import bwt_lote
+from utils.fasta_mmap import FastaMmap
 
 class TestBWT(unittest.TestCase):
     def test_bwt_transf(self):
@@ -28,6 +34,18 @@ class TestBWT(unittest.TestCase):
         self.assertEqual(index, 0)
 
 
+    def test_suffix_array(self):
+        # Comparação com a ordenação direta dos sufixos
+        for seq in ("banana$", "mississippi$", "ACGTTGCAACGT$", "a", ""):
+            self.assertEqual(list(suffix_array(seq)), sorted(range(len(seq)), key=lambda i: seq[i:]))
+
+        # A BWT obtida do array de sufixos coincide com a das rotações ordenadas
+        seq = "GATTACAGATTACACCAGT"
+        rotacoes = sorted((seq + "$")[i:] + (seq + "$")[:i] for i in range(len(seq) + 1))
+        bwt, index = bwt_transf(seq)
+        self.assertEqual(bwt, "".join(r[-1] for r in rotacoes))
+        self.assertEqual(index, rotacoes.index(seq + "$"))
+
     def test_bwt_reverse(self):
         # Teste básico
         bwt = "annb$aa"
@@ -44,5 +62,136 @@ class TestBWT(unittest.TestCase):
         original = bwt_reverse(bwt)
         self.assertEqual(original, "")
 
+        # Ida e volta numa sequência mais longa
+        seq = "GATTACAGATTACACCAGT" * 50
+        self.assertEqual(bwt_reverse(bwt_transf(seq)[0]), seq)
+
+    def test_bwt_compacta(self):
+        seq = "GATTACAGATTACACCAGT" * 7
+        bwt, _ = bwt_transf(seq)
+        compacta = BWTCompacta(bwt, intervalo_rank=8)
+        self.assertEqual(str(compacta), bwt)
+        self.assertEqual(len(compacta), len(bwt))
+        self.assertEqual(compacta[5], ord(bwt[5]))
+        for c in "ACGT$":
+            for i in (0, 1, 7, 8, 9, 63, len(bwt)):
+                self.assertEqual(compacta.rank(ord(c), i), bwt[:i].count(c))
+        self.assertLess(len(compacta.dados) * 4, len(bwt) + 4)
+
+        # Com o intervalo por omissão, dados e pontos de controlo ocupam menos de 1 / 3.75 bytes por base
+        longa = bwt_transf("GATTACAGATTACACCAGTTGCA" * 2000)[0]
+        grande = BWTCompacta(longa)
+        self.assertLess(grande.nbytes * 3.75, len(longa))
+        for c in "ACGT$":
+            for i in (0, 1023, 1024, 1025, 30000, len(longa)):
+                self.assertEqual(grande.rank(ord(c), i), longa[:i].count(c))
+
+        # bwt_reverse aceita a representação compacta
+        self.assertEqual(bwt_reverse(compacta), seq)
+
+        # Símbolos inválidos ou intervalo inválido
+        with self.assertRaises(ValueError):
+            BWTCompacta("ANNB$")
+        with self.assertRaises(ValueError):
+            BWTCompacta("ACGT")
+        with self.assertRaises(ValueError):
+            BWTCompacta(bwt, intervalo_rank=6)
+
+    def test_compressao(self):
+        # Etapas intermédias
+        dados = b"aaab\x00\x00\x00" + bytes(300) + b"zz"
+        self.assertEqual(inverter_mover_para_frente(mover_para_frente(dados)), dados)
+        self.assertEqual(mover_para_frente(b"aaab"), bytes([97, 0, 0, 98]))
+        self.assertEqual(descodificar_zeros(codificar_zeros(dados)), dados)
+        self.assertLess(len(codificar_zeros(dados)), 12)
+
+        # Ida e volta com vários tamanhos de bloco
+        seq = "GATTACAGATTACACCAGT" * 200
+        for tamanho in (1, 7, 1000, 1 << 18):
+            self.assertEqual(descomprimir(comprimir(seq, tamanho)), seq)
+        self.assertEqual(descomprimir(comprimir("")), "")
+        self.assertLess(len(comprimir(seq)), len(seq) // 10)
+
+        # Compressão a partir de partes do texto, com dois processos
+        saida = io.BytesIO()
+        comprimir_fluxo((seq[i:i + 333] for i in range(0, len(seq), 333)), saida, 500, processos=2)
+        saida.seek(0)
+        blocos = list(descomprimir_fluxo(saida, processos=2))
+        self.assertEqual([len(b) for b in blocos[:-1]], [500] * (len(blocos) - 1))
+        self.assertEqual("".join(blocos), seq)
+
+        # Entradas inválidas
+        with self.assertRaises(ValueError):
+            comprimir("a$b")
+        with self.assertRaises(ValueError):
+            comprimir(seq, 0)
+        with self.assertRaises(ValueError):
+            descomprimir(b"BZh9")
+        with self.assertRaises(ValueError):
+            descomprimir(comprimir(seq, 1000)[:-1])
+
+    def test_bwt_lote(self):
+        seqs = ["GATTACA", "", "ACGT" * 30, "banana"]
+        for processos in (1, 2):
+            res = list(bwt_lote(seqs, processos=processos))
+            self.assertEqual([r[0] for r in res], [0, 1, 2, 3])
+            self.assertEqual([(r[2], r[3]) for r in res], [bwt_transf(s) for s in seqs])
+            self.assertTrue(all(r[4] >= 0 for r in res))
+
+        # Divisão em blocos
+        res = list(bwt_lote(seqs, processos=2, tamanho_bloco=50))
+        self.assertEqual([(r[0], r[1]) for r in res], [(0, 0), (1, 0), (2, 0), (2, 50), (2, 100), (3, 0)])
+        self.assertEqual(res[3][2], bwt_transf(seqs[2][50:100])[0])
+
+        # Registos de um FASTA
+        fasta = FastaMmap(b">a\nGATT\nACA\n>b\nbanana\n")
+        self.assertEqual([r[2] for r in bwt_lote(fasta, processos=1)], [bwt_transf("GATTACA")[0], bwt_transf("banana")[0]])
+        fasta.close()
+
+        with self.assertRaises(ValueError):
+            bwt_lote(seqs, tamanho_bloco=0)
+
+    def test_bwt_multipla(self):
+        def por_ordenacao(seqs):
+            # Referência: ordena todos os sufixos, desempatando os terminadores pela ordem das sequências
+            sufixos = sorted((s[j:], i, j) for i, s in enumerate(seqs) for j in range(len(s) + 1))
+            return "".join(seqs[i][j - 1] if j else "$" for _, i, j in sufixos)
+
+        seqs = ["GATTACA", "ACGT", "", "TTAGGATTAC", "A", "GATTACA"]
+        for tamanho in (1, 3, 4096):
+            multipla = BWTMultipla(seqs[:2], tamanho_bloco=tamanho)
+            multipla.adicionar_lote(seqs[2:])
+            self.assertEqual(str(multipla), por_ordenacao(seqs))
+            self.assertEqual(list(multipla.sequencias()), seqs)
+            self.assertEqual(len(multipla), sum(map(len, seqs)) + len(seqs))
+
+        # Uma única sequência dá a mesma transformada que bwt_transf
+        self.assertEqual(str(BWTMultipla(["GATTACAGATTACA"])), bwt_transf("GATTACAGATTACA")[0])
+
+        # Junção de duas coleções
+        a = BWTMultipla(seqs[:3], tamanho_bloco=2)
+        a.juntar(BWTMultipla(seqs[3:]))
+        self.assertEqual(bytes(a), por_ordenacao(seqs).encode())
+        self.assertEqual(a[0], ord("A"))
+
+        # Blocos de um símbolo: a árvore de blocos tem vários níveis
+        seqs = ["GATTACA" * 9, "ACGT" * 20, "TTAGGATTAC" * 7]
+        multipla = BWTMultipla(seqs, tamanho_bloco=1)
+        self.assertEqual(str(multipla), por_ordenacao(seqs))
+        self.assertEqual(list(multipla.sequencias()), seqs)
+
+        # rank em todas as linhas, com símbolos que só aparecem depois de a árvore ter vários níveis
+        multipla = BWTMultipla(["ACCAACACCCAAACAC" * 20, "GT"], tamanho_bloco=1)
+        transformada = bytes(multipla)
+        for c in b"$ACGT":
+            for i in range(len(transformada) + 1):
+                self.assertEqual(multipla.rank(c, i), transformada[:i].count(c))
+
+        with self.assertRaises(ValueError):
+            a.adicionar("AC$")
+        with self.assertRaises(ValueError):
+            BWTMultipla(tamanho_bloco=0)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+# Add parent dir to path to ensure module is found
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import unittest
+
+from burrows_wheeler_transform import FMIndex, BWTCompacta, bwt_transf
+
+class TestFMIndex(unittest.TestCase):
+
+    def test_count_locate(self):
+        # Teste básico
+        fm = FMIndex(bwt_transf("banana")[0])
+        self.assertEqual(fm.count("ana"), 2)
+        self.assertEqual(fm.locate("ana"), [1, 3])
+        self.assertEqual(fm.locate("a"), [1, 3, 5])
+        self.assertEqual(fm.locate("banana"), [0])
+
+        # Padrões inexistentes
+        self.assertEqual(fm.count("nab"), 0)
+        self.assertEqual(fm.locate("xyz"), [])
+
+    def test_comparacao_procura_direta(self):
+        # Comparação com a procura direta, para vários intervalos entre pontos de controlo
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        sa = sorted(range(len(seq) + 1), key=lambda i: (seq + "$")[i:])
+        for intervalo, taxa in ((1, 1), (3, 4), (64, 32), (5, 100)):
+            fm = FMIndex.da_sequencia(seq, intervalo_occ=intervalo, taxa_sa=taxa)
+            self.assertEqual([fm.sufixo(i) for i in range(fm.n)], sa)
+            for padrao in ("ACCA", "A", "CC", "ATGG", "TTT"):
+                esperado = [i for i in range(len(seq)) if seq.startswith(padrao, i)]
+                self.assertEqual(fm.locate(padrao), esperado)
+
+    def test_bwt_compacta(self):
+        # O índice sobre a transformada compactada responde como o original
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC" * 20
+        bwt = bwt_transf(seq)[0]
+        fm = FMIndex(bwt)
+        compacto = FMIndex(BWTCompacta(bwt))
+        for padrao in ("ACCA", "A", "GATGAAC", "TTT", "N"):
+            self.assertEqual(compacto.locate(padrao), fm.locate(padrao))
+        self.assertLess(compacto.memoria()['bwt'], fm.memoria()['bwt'])
+
+        # O índice compactado também pode ser guardado e aberto
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "indice.fmi")
+            compacto.guardar(caminho)
+            with FMIndex.abrir(caminho) as aberto:
+                self.assertIsInstance(aberto.bwt, BWTCompacta)
+                self.assertEqual(bytes(aberto.bwt), bytes(compacto.bwt))
+                for padrao in ("ACCA", "A", "GATGAAC", "TTT", "N", ""):
+                    self.assertEqual(aberto.locate(padrao), compacto.locate(padrao))
+                self.assertEqual(aberto.memoria(), compacto.memoria())
+
+    def test_memoria(self):
+        # A amostragem reduz o espaço do array de sufixos
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC" * 100
+        completo = FMIndex.da_sequencia(seq, taxa_sa=1).memoria()
+        amostrado = FMIndex.da_sequencia(seq, taxa_sa=32).memoria()
+        self.assertLess(amostrado['sa'] * 8, completo['sa'])
+        self.assertEqual(amostrado['bwt'], len(seq) + 1)
+
+    def test_guardar_abrir(self):
+        # O índice aberto do ficheiro responde como o original
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC" * 20
+        fm = FMIndex.da_sequencia(seq, intervalo_occ=16, taxa_sa=8)
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "indice.fmi")
+            fm.guardar(caminho)
+            with FMIndex.abrir(caminho) as aberto:
+                self.assertEqual((aberto.n, aberto.intervalo_occ, aberto.taxa_sa), (fm.n, 16, 8))
+                for padrao in ("ACCA", "A", "GATGAAC", "TTT", ""):
+                    self.assertEqual(aberto.count(padrao), fm.count(padrao))
+                    self.assertEqual(aberto.locate(padrao), fm.locate(padrao))
+                self.assertEqual(aberto.memoria(), fm.memoria())
+
+            # Ficheiro inválido
+            with open(caminho, "wb") as f:
+                f.write(bytes(4096))
+            with self.assertRaises(ValueError):
+                FMIndex.abrir(caminho)
+
+    def test_locate_aproximado(self):
+        seq = "ATAGAACCAATGAACCATGATGAACCATGGATACCCAACCACC"
+        fm = FMIndex.da_sequencia(seq, intervalo_occ=4, taxa_sa=4)
+        inverso = FMIndex.da_sequencia(seq[::-1])
+        for padrao in ("ACCA", "GATGAAC", "TTTT", "ANCA", "A"):
+            for k in (0, 1, 2):
+                esperado = []
+                for i in range(len(seq) - len(padrao) + 1):
+                    diferencas = sum(a != b for a, b in zip(padrao, seq[i:i + len(padrao)]))
+                    if diferencas <= k:
+                        esperado.append((i, diferencas))
+                self.assertEqual(fm.locate_aproximado(padrao, k), esperado)
+                self.assertEqual(fm.locate_aproximado(padrao, k, inverso), esperado)
+
+        # Limites inferiores: "ACCT" e "TT" não ocorrem
+        self.assertEqual(inverso.limites_inferiores("ACCTTTT"), [0, 0, 0, 1, 1, 2, 2])
+        self.assertEqual(fm.locate_aproximado("ACCA", 0), [(i, 0) for i in fm.locate("ACCA")])
+        with self.assertRaises(ValueError):
+            fm.locate_aproximado("ACCA", -1)
+
+    def test_intervalo_invalido(self):
+        with self.assertRaises(ValueError):
+            FMIndex("annb$aa", intervalo_occ=0)
+        with self.assertRaises(ValueError):
+            FMIndex("annb$aa", taxa_sa=0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -6,7 +6,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
 
-from arvore_sufixos.Arvore_De_Sufixos import *
+from suffix_trees.Arvore_De_Sufixos import *
+from suffix_trees.Arvore_Ukkonen import *
 
 class TestArvoreDeSufixos(unittest.TestCase):
     """
@@ -47,6 +48,20 @@ class TestArvoreDeSufixos(unittest.TestCase):
         resultado = self.arvore.encontrar_padrao("xyz")
         self.assertIsNone(resultado)
 
+    def test_obter_folhas_abaixo_profundo(self):
+        """
+        Verifica se as folhas são obtidas sem recursão numa árvore mais profunda que o limite de recursão.
+        """
+        self.preparar_arvore_de_teste()
+        n = sys.getrecursionlimit() + 100
+        self.arvore.build_arvore_de_sufixos("A" * n)
+        self.assertEqual(self.arvore.encontrar_padrao("A" * (n - 1)), [0, 1])
+        self.assertEqual(sorted(self.arvore.encontrar_padrao("A")), list(range(n)))
+
+        # Os intervalos são recalculados depois de a árvore ser alterada
+        self.arvore.add_sufixo("AAC", n + 1)
+        self.assertEqual(self.arvore.encontrar_padrao("AAC"), [n + 1])
+
     def test_adicionar_sufixo_e_imprimir_arvore(self):
         """
         Verifica se a função de imprimir a árvore não gera erros para a sequência "banana".
@@ -59,6 +74,158 @@ class TestArvoreDeSufixos(unittest.TestCase):
         except Exception as e:
             self.fail(f"Erro ao imprimir a árvore: {e}")
 
+class TestArvoreDeSufixosCompacta(unittest.TestCase):
+    """
+    Testes para a classe ArvoreDeSufixosCompacta.
+    """
+
+    def test_encontrar_padrao(self):
+        """
+        Verifica se a árvore compactada encontra as mesmas folhas que a ArvoreDeSufixos.
+        """
+        seq = "GATTACAGATTACACCAGT"
+        compacta = ArvoreDeSufixosCompacta()
+        compacta.build_arvore_de_sufixos(seq)
+        arvore = ArvoreDeSufixos()
+        arvore.build_arvore_de_sufixos(seq)
+        for padrao in ("A", "GATTACA", "TAC", "CC", "T$", "", "GATTACAT", "xyz"):
+            esperado = arvore.encontrar_padrao(padrao)
+            resultado = compacta.encontrar_padrao(padrao)
+            if esperado is None:
+                self.assertIsNone(resultado)
+            else:
+                self.assertEqual(sorted(resultado), sorted(esperado))
+
+    def test_estrutura(self):
+        """
+        Verifica a ordem das folhas, o número de nodos e as etiquetas das arestas para "banana".
+        """
+        arvore = ArvoreDeSufixosCompacta()
+        arvore.build_arvore_de_sufixos("banana")
+        self.assertEqual(arvore.encontrar_padrao("ana"), [3, 1])
+        self.assertEqual(arvore.obter_folhas_abaixo(0), [6, 5, 3, 1, 0, 4, 2])
+        self.assertEqual(arvore.folhas.tolist(), [6, 5, 3, 1, 0, 4, 2])
+        # 7 folhas, 3 nodos internos e a raiz
+        self.assertEqual(len(arvore.nos), 11)
+        no = arvore.nos.filho(0, arvore.codigos["n"])
+        self.assertEqual(arvore.nos.fim[no] - arvore.nos.inicio[no], 2)
+
+    def test_armazenamento_compacto(self):
+        """
+        Verifica se o armazenamento em arrays dá a mesma árvore que o armazenamento em dicionários.
+        """
+        seq = "GATTACAGATTACACCAGT" * 5
+        dicionario = ArvoreDeSufixosCompacta()
+        dicionario.build_arvore_de_sufixos(seq)
+        compacta = ArvoreDeSufixosCompacta(NosCompactos)
+        compacta.build_arvore_de_sufixos(seq)
+        self.assertEqual(compacta.nos.largura, 5)
+        self.assertEqual(len(compacta.nos), len(dicionario.nos))
+        self.assertEqual(compacta.obter_folhas_abaixo(0), dicionario.obter_folhas_abaixo(0))
+        for padrao in ("A", "GATTACA", "CAGTG", "CC", "", "GATTACAT", "N"):
+            self.assertEqual(compacta.encontrar_padrao(padrao), dicionario.encontrar_padrao(padrao))
+        self.assertEqual(compacta.nos.nbytes, 4 * 10 * len(compacta.nos))
+
+    def test_sequencia_invalida(self):
+        """
+        Verifica se uma sequência com '$' é rejeitada.
+        """
+        with self.assertRaises(ValueError):
+            ArvoreDeSufixosCompacta().build_arvore_de_sufixos("ba$nana")
+
+class TestArvoreDeSufixosGeneralizada(unittest.TestCase):
+    """
+    Testes para a classe ArvoreDeSufixosGeneralizada.
+    """
+
+    def test_encontrar_padrao(self):
+        """
+        Verifica se uma procura devolve as ocorrências em todas as sequências.
+        """
+        seqs = ["GATTACA", "TACAGATTA", "", "CCCC", "ATTAC"]
+        for armazenamento in (NosDicionario, NosCompactos):
+            arvore = ArvoreDeSufixosGeneralizada(armazenamento)
+            arvore.build_arvore_de_sufixos(seqs)
+            for padrao in ("A", "ATTA", "TACA", "CC", "GATTACA", "N", "ACAG"):
+                esperado = [(k, i) for k, seq in enumerate(seqs) for i in range(len(seq)) if seq.startswith(padrao, i)]
+                resultado = arvore.encontrar_padrao(padrao)
+                if esperado:
+                    self.assertEqual(sorted(resultado), esperado)
+                else:
+                    self.assertIsNone(resultado)
+
+            # As folhas ficam por ordem dos sufixos, com os terminadores pela ordem das sequências
+            sufixos = sorted((seq[i:], k, i) for k, seq in enumerate(seqs) for i in range(len(seq) + 1))
+            self.assertEqual(arvore.obter_folhas_abaixo(0), [(k, i) for _, k, i in sufixos])
+
+    def test_arestas_das_folhas(self):
+        """
+        Verifica se as arestas das folhas terminam no terminador da própria sequência.
+        """
+        arvore = ArvoreDeSufixosGeneralizada(NosCompactos)
+        arvore.build_arvore_de_sufixos(["banana", "ananas"])
+        self.assertEqual(arvore.nos.largura, 5)
+        for no in range(len(arvore.nos)):
+            if arvore.nos.folha[no] >= 0:
+                k, i = arvore.posicao(arvore.nos.folha[no])
+                self.assertEqual(arvore.nos.fim[no], arvore.inicios[k] + len(["banana", "ananas"][k]) + 1)
+        self.assertEqual(arvore.posicao(7), (1, 0))
+
+class TestAnaliseDeRepeticoes(unittest.TestCase):
+    """
+    Testes para a maior repetição, a maior substring comum e as repetições máximas.
+    """
+
+    def test_maior_repeticao(self):
+        """
+        Verifica a maior repetição de algumas sequências.
+        """
+        for seq, esperado in (("banana", "ana"), ("GATTACAGATTACA", "GATTACA"), ("ACGT", ""), ("", "")):
+            arvore = ArvoreDeSufixosCompacta(NosCompactos)
+            arvore.build_arvore_de_sufixos(seq)
+            self.assertEqual(arvore.maior_repeticao(), esperado)
+
+    def test_maior_substring_comum(self):
+        """
+        Verifica a maior substring comum entre duas sequências.
+        """
+        arvore = ArvoreDeSufixosGeneralizada()
+        arvore.build_arvore_de_sufixos(["xabxac", "abcabxabcd"])
+        self.assertEqual(arvore.maior_substring_comum(), "abxa")
+        arvore.build_arvore_de_sufixos(["ACGT", "TTTT"])
+        self.assertEqual(arvore.maior_substring_comum(), "T")
+        arvore.build_arvore_de_sufixos(["ACGT", "NNN"])
+        self.assertEqual(arvore.maior_substring_comum(), "")
+
+        # Árvores sem folhas: sem sequências ou ainda não construídas
+        arvore.build_arvore_de_sufixos([])
+        self.assertEqual(arvore.maior_substring_comum(), "")
+        self.assertEqual(arvore.maior_repeticao(), "")
+        self.assertEqual(arvore.repeticoes_maximas(), [])
+        self.assertEqual(ArvoreDeSufixosGeneralizada().maior_substring_comum(), "")
+        self.assertEqual(ArvoreDeSufixosCompacta(NosCompactos).maior_repeticao(), "")
+        self.assertEqual(ArvoreDeSufixosCompacta().repeticoes_maximas(), [])
+
+    def test_repeticoes_maximas(self):
+        """
+        Verifica as repetições máximas por comparação com a enumeração de todas as substrings.
+        """
+        seq = "GATTACAGATTACACCAGT"
+        contagens = {}
+        for i in range(len(seq)):
+            for j in range(i + 1, len(seq) + 1):
+                contagens[seq[i:j]] = contagens.get(seq[i:j], 0) + 1
+        esperado = []
+        for w, n in contagens.items():
+            if n >= 2 and all(contagens.get(w + c, 0) < n and contagens.get(c + w, 0) < n for c in "ACGT"):
+                esperado.append((w, n))
+
+        arvore = ArvoreDeSufixosCompacta()
+        arvore.build_arvore_de_sufixos(seq)
+        self.assertEqual(arvore.repeticoes_maximas(), sorted(esperado))
+        self.assertEqual(arvore.repeticoes_maximas(4), sorted((w, n) for w, n in esperado if len(w) >= 4))
+        self.assertIn(("GATTACA", 2), esperado)
+
  
 if __name__ == '__main__':
     unittest.main()
@@ -3,10 +3,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import tempfile
 import unittest
-from utils import pwm
-
-# TODO testar gerador_seqs
+from utils import pwm, FastaMmap, gerador_seqs
 
 class TestarUtils(unittest.TestCase):
 
@@ -36,6 +35,49 @@ class TestarUtils(unittest.TestCase):
         with self.assertRaises(AssertionError):
             pwm(seqs)
 
+    def test_gerador_seqs(self):
+
+        seqs = gerador_seqs(10, 3)
+        self.assertEqual(len(seqs), 3)
+        self.assertTrue(all(len(seq) == 10 and set(seq) <= set('ACGT') for seq in seqs))
+
+        # Alfabeto alternativo
+        seqs = gerador_seqs(50, 2, 'XY')
+        self.assertTrue(all(set(seq) <= set('XY') for seq in seqs))
+
+    def test_fasta_mmap(self):
+
+        fasta = b">seq1 teste\nACGTAC\nGTA\r\n\n>seq2\nTTTT\nGG\n"
+        with tempfile.NamedTemporaryFile(suffix='.fasta') as f:
+            f.write(fasta)
+            f.flush()
+            with FastaMmap(f.name) as fm:
+                self.assertEqual(fm.nomes, ['seq1 teste', 'seq2'])
+                self.assertEqual(fm.comprimento(0), 9)
+                self.assertEqual(''.join(fm.blocos(4, 0)), 'ACGTACGTA')
+                self.assertEqual(''.join(fm.blocos(100, 1)), 'TTTTGG')
+                self.assertEqual([bytes(s) for s in fm.segmentos(1)], [b'TTTT', b'GG'])
+                self.assertEqual(fm.fatia(4, 8, 0), 'ACGT')
+                self.assertEqual(fm.fatia(3, 100, 1), 'TGG')
+
+                # Uma vista de segmentos() por libertar impede o fecho do mmap
+                vista = next(fm.segmentos(0))
+                with self.assertRaises(BufferError):
+                    fm.close()
+                vista.release()
+
+        # Buffer em memória em vez de ficheiro
+        fm = FastaMmap(fasta)
+        self.assertEqual(list(fm.blocos(2, 1)), ['TTTT', 'GG'])
+
+        # Registos com linhas de largura fixa não têm índice por linha; os irregulares têm
+        fm = FastaMmap(b">fixo\n" + b"ACGTACGTAC\n" * 1000 + b"ACG\n>irregular\nACG\nACGTA\n\nAC\n")
+        self.assertEqual(list(fm._linhas), [1])
+        self.assertEqual(fm.comprimento(0), 10003)
+        self.assertEqual(fm.fatia(9995, 10003, 0), 'CGTACACG')
+        self.assertEqual(fm.fatia(1, 9, 1), 'CGACGTAA')
+        self.assertEqual([bytes(s) for s in fm.segmentos(1)], [b'ACG', b'ACGTA', b'AC'])
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
 
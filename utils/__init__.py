@@ -3,3 +3,5 @@ Initialize utils module
 """
 from .pwm import pwm
 from .gerador_seqs import gerador_seqs
+from .fasta_mmap import FastaMmap
+from .complemento import complemento_reverso
@@ -0,0 +1,18 @@
+"""
+Complemento reverso de sequências de DNA, partilhado pelos algoritmos de procura.
+"""
+
+_COMPLEMENTO = str.maketrans("ACGTNacgtn", "TGCANtgcan")
+
+def complemento_reverso(seq : str) -> str:
+    """
+    Retorna o complemento reverso de uma sequência de DNA, mantendo as minúsculas e os 'N'.
+
+    Parâmetros:
+        seq (str): A sequência de DNA.
+
+    Retorna:
+        str: O complemento reverso da sequência.
+    """
+
+    return seq.translate(_COMPLEMENTO)[::-1]
@@ -0,0 +1,260 @@
+"""
+Acesso a ficheiros FASTA através de mmap, sem ler nem descodificar o ficheiro completo.
+"""
+
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_right
+from typing import Iterator, Union
+
+_LINHA = re.compile(rb'[^\r\n]+')
+
+class FastaMmap:
+    """
+    Vista sobre um ficheiro FASTA (ou um buffer de bytes) que ignora cabeçalhos e quebras de linha.
+
+    Como num índice .fai, cada registo guarda apenas a posição da sua primeira linha de sequência,
+    o número de nucleótidos por linha e a distância (em bytes) entre o início de linhas
+    consecutivas, pelo que a posição de qualquer nucleótido é calculada diretamente e o índice
+    não cresce com o número de linhas. Só os registos com linhas de tamanho irregular (ou linhas
+    em branco no meio da sequência) têm um índice com a posição de cada linha. A sequência é
+    percorrida por segmentos (memoryview) sem copiar os dados.
+
+    Atributos:
+        dados (memoryview): Os bytes do ficheiro ou buffer.
+        nomes (List[str]): Os cabeçalhos dos registos, pela ordem do ficheiro.
+    """
+
+    def __init__(self, fonte : Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap]) -> None:
+        """
+        Abre (ou recebe) os dados e constrói o índice de linhas.
+
+        Parâmetros:
+            fonte: Caminho para o ficheiro FASTA, ou objeto bytes/bytearray/memoryview/mmap com o seu conteúdo.
+
+        Retorna:
+            None
+
+        Raises:
+            ValueError: Se o ficheiro estiver vazio.
+        """
+
+        self._mmap = None
+        if isinstance(fonte, (str, os.PathLike)):
+            with open(fonte, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raise ValueError("O ficheiro FASTA está vazio.")
+                self._mmap = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+            fonte = self._mmap
+        self.dados = memoryview(fonte).cast('B')
+        self.indexar()
+
+    def indexar(self) -> None:
+        """
+        Constrói o índice de cada registo, numa única passagem pelas linhas do ficheiro.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+        """
+
+        self.nomes = []
+        self._primeira = array('Q')  # posição no ficheiro da primeira linha de sequência
+        self._largura = array('Q')   # nucleótidos por linha (todas exceto a última)
+        self._passo = array('Q')     # distância no ficheiro entre o início de linhas consecutivas
+        self._total = array('Q')     # comprimento da sequência
+        self._linhas = {}            # registos irregulares: (início, acumulado, comprimento) de cada linha
+
+        primeira = largura = passo = total = ultimo_fim = 0
+        anterior = -1                # início da linha anterior do registo
+        regular = True
+        for linha in _LINHA.finditer(self.dados):
+            inicio, fim = linha.span()
+            if self.dados[inicio] == ord('>'):
+                if self.nomes:
+                    self._fechar_registo(primeira, largura, passo, total, regular, ultimo_fim)
+                self.nomes.append(bytes(self.dados[inicio + 1:fim]).decode().strip())
+                primeira = largura = passo = total = ultimo_fim = 0
+                anterior = -1
+                regular = True
+                continue
+            if not self.nomes:
+                self.nomes.append("")
+            n = fim - inicio
+            if anterior < 0:
+                primeira, largura = inicio, n
+            else:
+                # A linha anterior não é a última: tem de ter a largura das restantes e o mesmo passo
+                if ultimo_fim - anterior != largura or n > largura:
+                    regular = False
+                if passo == 0:
+                    passo = inicio - anterior
+                elif inicio - anterior != passo:
+                    regular = False
+            anterior = inicio
+            ultimo_fim = fim
+            total += n
+        if self.nomes:
+            self._fechar_registo(primeira, largura, passo, total, regular, ultimo_fim)
+
+    def _fechar_registo(self, primeira : int, largura : int, passo : int, total : int,
+                        regular : bool, fim : int) -> None:
+        """
+        Acrescenta um registo ao índice; se as linhas forem irregulares, indexa cada linha do registo.
+
+        Parâmetros:
+            primeira (int): Posição no ficheiro da primeira linha de sequência.
+            largura (int): Nucleótidos da primeira linha.
+            passo (int): Distância entre o início das duas primeiras linhas.
+            total (int): Comprimento da sequência.
+            regular (bool): Se todas as linhas (exceto a última) têm a mesma largura e o mesmo passo.
+            fim (int): Posição no ficheiro do fim da última linha de sequência.
+
+        Retorna:
+            None
+        """
+
+        if not regular:
+            inicios, acumulados, comprimentos = array('Q'), array('Q'), array('Q')
+            acumulado = 0
+            for linha in _LINHA.finditer(self.dados, primeira, fim):
+                inicio, fim_linha = linha.span()
+                inicios.append(inicio)
+                acumulados.append(acumulado)
+                comprimentos.append(fim_linha - inicio)
+                acumulado += fim_linha - inicio
+            self._linhas[len(self._total)] = (inicios, acumulados, comprimentos)
+        self._primeira.append(primeira)
+        self._largura.append(largura)
+        self._passo.append(passo)
+        self._total.append(total)
+
+    def _linha(self, registo : int, i : int) -> tuple:
+        """
+        Localiza um nucleótido no ficheiro.
+
+        Parâmetros:
+            registo (int): Índice do registo.
+            i (int): Posição na sequência (0 <= i < comprimento).
+
+        Retorna:
+            tuple: (posição no ficheiro, número de nucleótidos desde i até ao fim da sua linha)
+        """
+
+        if registo in self._linhas:
+            inicios, acumulados, comprimentos = self._linhas[registo]
+            k = bisect_right(acumulados, i) - 1
+            desloc = i - acumulados[k]
+            return inicios[k] + desloc, comprimentos[k] - desloc
+        largura = self._largura[registo]
+        k, desloc = divmod(i, largura)
+        return self._primeira[registo] + k * self._passo[registo] + desloc, min(largura - desloc, self._total[registo] - i)
+
+    def comprimento(self, registo : int = 0) -> int:
+        """
+        Devolve o comprimento da sequência de um registo.
+
+        Parâmetros:
+            registo (int): Índice do registo. Padrão é 0.
+
+        Retorna:
+            int: Número de nucleótidos do registo.
+        """
+
+        return self._total[registo]
+
+    def segmentos(self, registo : int = 0) -> Iterator[memoryview]:
+        """
+        Percorre a sequência de um registo linha a linha, sem cópias.
+        As vistas têm de ser libertadas antes de close().
+
+        Parâmetros:
+            registo (int): Índice do registo. Padrão é 0.
+
+        Retorna:
+            Iterator[memoryview]: Gerador de vistas sobre as linhas de sequência.
+        """
+
+        i = 0
+        total = self._total[registo]
+        while i < total:
+            pos, n = self._linha(registo, i)
+            yield self.dados[pos:pos + n]
+            i += n
+
+    def blocos(self, tamanho : int = 1 << 20, registo : int = 0) -> Iterator[str]:
+        """
+        Percorre a sequência de um registo em blocos de texto de tamanho aproximadamente fixo.
+        Apenas um bloco é descodificado de cada vez.
+
+        Parâmetros:
+            tamanho (int): Número mínimo de nucleótidos por bloco (exceto o último). Padrão é 1 MiB.
+            registo (int): Índice do registo. Padrão é 0.
+
+        Retorna:
+            Iterator[str]: Gerador dos blocos da sequência.
+        """
+
+        partes = []
+        acumulado = 0
+        for segmento in self.segmentos(registo):
+            partes.append(segmento)
+            acumulado += len(segmento)
+            if acumulado >= tamanho:
+                yield b''.join(partes).decode('ascii')
+                partes = []
+                acumulado = 0
+        if partes:
+            yield b''.join(partes).decode('ascii')
+
+    def fatia(self, inicio : int, fim : int, registo : int = 0) -> str:
+        """
+        Extrai uma parte da sequência de um registo usando o índice de linhas.
+
+        Parâmetros:
+            inicio (int): Posição inicial na sequência (inclusiva).
+            fim (int): Posição final na sequência (exclusiva).
+            registo (int): Índice do registo. Padrão é 0.
+
+        Retorna:
+            str: A subsequência pedida.
+        """
+
+        inicio, fim = max(0, inicio), min(fim, self._total[registo])
+        partes = []
+        while inicio < fim:
+            pos, n = self._linha(registo, inicio)
+            n = min(n, fim - inicio)
+            partes.append(self.dados[pos:pos + n])
+            inicio += n
+        return b''.join(partes).decode('ascii')
+
+    def close(self) -> None:
+        """
+        Liberta a vista sobre os dados e fecha o mmap, se tiver sido aberto por esta classe.
+        As vistas devolvidas por segmentos() partilham o mmap e têm de ser libertadas (release())
+        ou descartadas antes; caso contrário o mmap não pode ser fechado.
+
+        Parâmetros:
+            None
+
+        Retorna:
+            None
+
+        Raises:
+            BufferError: Se ainda existirem vistas de segmentos() por libertar.
+        """
+
+        self.dados.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> "FastaMmap":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
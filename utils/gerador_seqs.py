@@ -4,12 +4,12 @@ Generate random sequences for testing purposes.
 
 from random import choice
 
-def gerador_seqs(len_seqs : int , num_seqs : int) -> list[str]:
+def gerador_seqs(len_seqs : int , num_seqs : int, alfabeto : str = 'ACGT') -> list[str]:
     """
     Função simples de geração de num_seqs número de sequências de DNA aleatórias
     de tamanho len_seqs utilizando a função choice do módulo random.
 
     Recebe dois números inteiros, len_seqs e num_seqs e devolve uma lista de num_seqs
-    strings de tamanho len_seqs.
+    strings de tamanho len_seqs. Opcionalmente recebe o alfabeto a usar (por omissão 'ACGT').
     """
-    return [''.join(choice('ACGT') for p in range(len_seqs)) for i in range(num_seqs)]
+    return [''.join(choice(alfabeto) for p in range(len_seqs)) for i in range(num_seqs)]